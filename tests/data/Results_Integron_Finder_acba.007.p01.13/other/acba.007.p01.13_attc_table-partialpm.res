@@ -0,0 +1,15 @@
+#target name         accession query name           accession mdl mdl from   mdl to seq from   seq to strand trunc pass   gc  bias  score   E-value inc description of target
+#------------------- --------- -------------------- --------- --- -------- -------- -------- -------- ------ ----- ---- ---- ----- ------ --------- --- ---------------------
+ACBA.007.P01_13      -         attC_4               -          cm        1       40    17825    17884      +    no    1 0.55   0.0   46.4     1e-09 !   08-JUN-2013 20301 bp Acinetobacter baumannii MDR-ZJ06 plasmid pMDR-ZJ06, complete
+ACBA.007.P01_13      -         attC_4               -          cm        10       47    19726    19618      -    no    1 0.59   0.0   38.4   1.1e-07 !   08-JUN-2013 20301 bp Acinetobacter baumannii MDR-ZJ06 plasmid pMDR-ZJ06, complete
+ACBA.007.P01_13      -         attC_4               -          cm        1       47    19080    19149      +    no    1 0.69   0.0   26.6    0.0001 !   08-JUN-2013 20301 bp Acinetobacter baumannii MDR-ZJ06 plasmid pMDR-ZJ06, complete
+#
+# Program:         cmsearch
+# Version:         1.1.1 (July 2014)
+# Pipeline mode:   SEARCH
+# Query file:      /usr/local/share/integron_finder/data/Models/attc_4.cm
+# Target file:     /home/if/data/acba.007.p01.13.fst
+# Option settings: /usr/lib/infernal/cmsearch -o data/Results_Integron_Finder_acba.007.p01.13/other/acba.007.p01.13_attc.res --tblout data/Results_Integron_Finder_acba.007.p01.13/other/acba.007.p01.13_attc_table.res -E 10 --cpu 1 /usr/local/share/integron_finder/data/Models/attc_4.cm /home/if/data/acba.007.p01.13.fst 
+# Current dir:     /home/if
+# Date:            Tue Nov  8 10:21:29 2016
+# [ok]
@@ -0,0 +1,17 @@
+#                                                                            --- full sequence --- -------------- this domain -------------   hmm coord   ali coord   env coord
+# target name        accession   tlen query name           accession   qlen   E-value  score  bias   #  of  c-Evalue  i-Evalue  score  bias  from    to  from    to  from    to  acc description of target
+#------------------- ---------- ----- -------------------- ---------- ----- --------- ------ ----- --- --- --------- --------- ------ ----- ----- ----- ----- ----- ----- ----- ---- ---------------------
+ACBA.007.P01_13_1    -            319 intI_Cterm           -             59   1.1e-25   79.7   3.3   1   1   8.4e-27   1.9e-25   78.9   3.3     2    58   198   254   197   255 0.96 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+ACBA.007.P01_13_3    -            166 intI_Cterm           -             59   1.1e-20   65.2   1.3   1   2   4.1e-05   0.00093   12.1   0.1     1    20    10    29     9    30 0.90 # 3000 # 3500 # 1 # ID=1_3;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.550
+ACBA.007.P01_13_3    -            166 intI_Cterm           -             59   1.1e-20   65.2   1.3   2   2   8.8e-23   2.0e-21   60.3   1.2     3    57    98   152    97   153 0.95 # 3000 # 3500 # 1 # ID=1_3;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.550
+ACBA.007.P01_13_1    -            319 Phage_integrase      PF00589.21   173   2.3e-10   39.9   0.1   1   1   5.1e-12   2.9e-10   39.6   0.1     4   170   120   295   117   297 0.85 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+#
+# Program:         hmmsearch
+# Version:         3.1b2 (February 2015)
+# Pipeline mode:   SEARCH
+# Query file:      integron_integrase.hmm
+# Target file:     acba.007.p01.13.prt
+# Option settings: hmmsearch --domtblout acba.007.p01.13_intI_domtbl.res acba.007.p01.13.prt
+# Current dir:     /home/if
+# Date:            Tue Nov  8 10:21:28 2016
+# [ok]
@@ -0,0 +1,6 @@
+#                                                                            --- full sequence --- -------------- this domain -------------   hmm coord   ali coord   env coord
+# target name        accession   tlen query name           accession   qlen   E-value  score  bias   #  of  c-Evalue  i-Evalue  score  bias  from    to  from    to  from    to  acc description of target
+#------------------- ---------- ----- -------------------- ---------- ----- --------- ------ ----- --- --- --------- --------- ------ ----- ----- ----- ----- ----- ----- ----- ---- ---------------------
+ACBA.007.P01_13_1    -            320 intI_Cterm           -             59   1.1e-25   79.7   3.3   1   1   8.4e-27   1.9e-25   78.9   3.3     2    58   198   254   197   255 0.96 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+ACBA.007.P01_13_1    -            320 Phage_integrase      PF00589.16   173   4.4e-39  124.7   0.0   1   2      0.18       4.2   -2.2   0.0     3    26    56    83    54    88 0.66 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+ACBA.007.P01_13_1    -            320 Phage_integrase      PF00589.16   173   4.4e-39  124.7   0.0   2   2   5.4e-40   1.2e-38  123.2   0.0     2   121   116   267   115   279 0.97 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
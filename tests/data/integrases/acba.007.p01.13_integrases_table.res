@@ -0,0 +1,5 @@
+#                                                               --- full sequence ---- --- best 1 domain ---- --- domain number estimation ----
+# target name        accession  query name           accession    E-value  score  bias   E-value  score  bias   exp reg clu  ov env dom rep inc description of target
+#------------------- ---------- -------------------- ---------- --------- ------ ----- --------- ------ -----   --- --- --- --- --- --- --- --- ---------------------
+ACBA.007.P01_13_1    -          intI_Cterm           -            1.1e-25   79.7   3.3   1.9e-25   78.9   3.3   1.4   1   0   0   1   1   1   1 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+ACBA.007.P01_13_1    -          Phage_integrase      PF00589.16   4.4e-39  124.7   0.0   1.2e-38  123.2   0.0   1.7   2   0   0   2   2   2   1 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
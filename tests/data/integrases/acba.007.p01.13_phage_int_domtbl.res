@@ -0,0 +1,5 @@
+#                                                                            --- full sequence --- -------------- this domain -------------   hmm coord   ali coord   env coord
+# target name        accession   tlen query name           accession   qlen   E-value  score  bias   #  of  c-Evalue  i-Evalue  score  bias  from    to  from    to  from    to  acc description of target
+#------------------- ---------- ----- -------------------- ---------- ----- --------- ------ ----- --- --- --------- --------- ------ ----- ----- ----- ----- ----- ----- ----- ---- ---------------------
+ACBA.007.P01_13_1    -            320 Phage_integrase      PF00589.16   173   4.4e-39  124.7   0.0   1   2      0.18       4.2   -2.2   0.0     3    26    56    83    54    88 0.66 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
+ACBA.007.P01_13_1    -            320 Phage_integrase      PF00589.16   173   4.4e-39  124.7   0.0   2   2   5.4e-40   1.2e-38  123.2   0.0     2   121   116   267   115   279 0.97 # 55 # 1014 # 1 # ID=1_1;partial=00;start_type=ATG;rbs_motif=None;rbs_spacer=None;gc_cont=0.585
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests _call_bank function of integron_finder
+"""
+
+import os
+import tempfile
+import shutil
+import unittest
+
+import integron_finder
+
+
+class TestCallBank(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        # bigger than a pipe buffer
+        self.bank = os.path.join(self.tmp_dir, 'bank.hmm')
+        with open(self.bank, 'w') as bank_file:
+            bank_file.write("HMMER3/f\n" * 100000)
+
+    def tearDown(self):
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+
+    def test_call_bank(self):
+        out = os.path.join(self.tmp_dir, 'out.hmm')
+        with open(out, 'w') as out_file:
+            out_file.write('')
+        returncode = integron_finder._call_bank(['sh', '-c', 'cat > {}'.format(out)], [self.bank, self.bank])
+        self.assertEqual(returncode, 0)
+        self.assertEqual(os.path.getsize(out), 2 * os.path.getsize(self.bank))
+
+
+    def test_broken_pipe(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            integron_finder._call_bank(['false'], [self.bank, self.bank])
+        self.assertTrue(str(ctx.exception).startswith("false failed return code = 1 "
+                                                      "(the profiles could not be written on its "
+                                                      "standard input: [Errno 32] Broken pipe"))
+
+
+    def test_no_bank(self):
+        with self.assertRaises(IOError):
+            integron_finder._call_bank(['sh', '-c', 'cat > /dev/null'], [self.bank, 'foo.hmm'])
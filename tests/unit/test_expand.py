@@ -77,6 +77,7 @@ class TestExpand(unittest.TestCase):
         max_elt_input = pd.read_csv(os.path.join(self._data_dir, 'max_elt_input_1.csv'))
         df_max_input = pd.read_csv(os.path.join(self._data_dir, 'df_max_input_1.csv'))
         max_elt_expected = pd.read_csv(os.path.join(self._data_dir, 'max_elt_output_lian_right.csv'))
+        max_elt_expected = max_elt_expected.astype(dtype=integron_finder.ATTC_DTYPE)
         max_eat_received = integron_finder.expand(934689, 943099, max_elt_input, df_max_input,
                                                   search_left=False, search_right=True)
         pdt.assert_frame_equal(max_elt_expected, max_eat_received)
@@ -95,6 +96,7 @@ class TestExpand(unittest.TestCase):
         max_elt_input = pd.read_csv(os.path.join(self._data_dir, 'max_elt_input_1.csv'))
         df_max_input = pd.read_csv(os.path.join(self._data_dir, 'df_max_input_1.csv'))
         max_elt_expected = pd.read_csv(os.path.join(self._data_dir, 'max_elt_output_lian_left.csv'))
+        max_elt_expected = max_elt_expected.astype(dtype=integron_finder.ATTC_DTYPE)
         max_eat_received = integron_finder.expand(934689, 943099, max_elt_input, df_max_input,
                                                   search_left=True, search_right=False)
         pdt.assert_frame_equal(max_elt_expected, max_eat_received)
@@ -113,6 +115,7 @@ class TestExpand(unittest.TestCase):
         max_elt_input = pd.read_csv(os.path.join(self._data_dir, 'max_elt_input_1.csv'))
         df_max_input = pd.read_csv(os.path.join(self._data_dir, 'df_max_input_1.csv'))
         max_elt_expected = pd.read_csv(os.path.join(self._data_dir, 'max_elt_output_lian_right.csv'))
+        max_elt_expected = max_elt_expected.astype(dtype=integron_finder.ATTC_DTYPE)
         max_eat_received = integron_finder.expand(934689, 943099, max_elt_input, df_max_input,
                                                   search_left=False, search_right=True)
         pdt.assert_frame_equal(max_elt_expected, max_eat_received)
@@ -131,6 +134,7 @@ class TestExpand(unittest.TestCase):
         max_elt_input = pd.read_csv(os.path.join(self._data_dir, 'max_elt_input_1.csv'))
         df_max_input = pd.read_csv(os.path.join(self._data_dir, 'df_max_input_1.csv'))
         max_elt_expected = pd.read_csv(os.path.join(self._data_dir, 'max_elt_output_lian_left.csv'))
+        max_elt_expected = max_elt_expected.astype(dtype=integron_finder.ATTC_DTYPE)
         max_eat_received = integron_finder.expand(934689, 943099, max_elt_input, df_max_input,
                                                   search_left=True, search_right=False)
         pdt.assert_frame_equal(max_elt_expected, max_eat_received)
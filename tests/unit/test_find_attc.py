@@ -13,6 +13,8 @@ import unittest
 import integron_finder
 from tests import which
 
+_call_ori = integron_finder.call
+
 class TestFindAttc(unittest.TestCase):
 
     _data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', "data"))
@@ -33,6 +35,7 @@ class TestFindAttc(unittest.TestCase):
 
 
     def tearDown(self):
+        integron_finder.call = _call_ori
         try:
             shutil.rmtree(self.tmp_dir)
         except:
@@ -61,3 +64,18 @@ class TestFindAttc(unittest.TestCase):
         with self.assertRaises(RuntimeError) as ctx:
             integron_finder.find_attc(replicon_path, replicon_name, self.tmp_dir)
         self.assertEqual(str(ctx.exception), '{} failed returncode = 1'.format(integron_finder.CMSEARCH))
+
+    def test_find_attc_cpu(self):
+        integron_finder.N_CPU = '4'
+        cmds = []
+
+        def fake_call(cmd, **kwargs):
+            cmds.append(cmd)
+            return 0
+
+        integron_finder.call = fake_call
+        replicon_name = 'acba.007.p01.13'
+        replicon_path = os.path.join(self._data_dir, 'Replicons', replicon_name + '.fst')
+        integron_finder.find_attc(replicon_path, replicon_name, self.tmp_dir)
+        integron_finder.find_attc(replicon_path, replicon_name, self.tmp_dir, '2')
+        self.assertEqual([cmd[cmd.index('--cpu') + 1] for cmd in cmds], ['4', '2'])
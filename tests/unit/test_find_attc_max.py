@@ -21,6 +21,8 @@ from integron_finder import Integron
 
 from tests import which
 
+_local_max_ori = integron_finder.local_max
+
 
 class TestFindFindAttCMax(unittest.TestCase):
 
@@ -56,26 +58,27 @@ class TestFindFindAttCMax(unittest.TestCase):
         integron_finder.DISTANCE_THRESHOLD = 4000  # (4kb at least between 2 different arrays)
 
         self.columns = ['pos_beg', 'pos_end', 'strand', 'evalue', 'type_elt', 'model', 'distance_2attC', 'annotation']
-        self.dtype = {"pos_beg": 'int',
-                      "pos_end": 'int',
-                      "strand": 'int',
+        self.dtype = {"pos_beg": 'int32',
+                      "pos_end": 'int32',
+                      "strand": 'int8',
                       "evalue": 'float',
                       "type_elt": 'str',
-                      "annotation": 'str',
-                      "model": 'str',
+                      "annotation": 'category',
+                      "model": 'category',
                       "distance_2attC": 'float'}
 
-        self.max_dtype = {'Accession_number': 'str',
-                          'cm_attC': 'str',
-                          'cm_debut': 'int',
-                          'cm_fin': 'int',
-                          'pos_beg': 'int',
-                          'pos_end': 'int',
+        self.max_dtype = {'Accession_number': 'category',
+                          'cm_attC': 'category',
+                          'cm_debut': 'int32',
+                          'cm_fin': 'int32',
+                          'pos_beg': 'int32',
+                          'pos_end': 'int32',
                           'sens': 'str',
                           'evalue': 'float'}
         self.max_cols = ['Accession_number', 'cm_attC', 'cm_debut', 'cm_fin', 'pos_beg', 'pos_end', 'sens', 'evalue']
 
     def tearDown(self):
+        integron_finder.local_max = _local_max_ori
         try:
             shutil.rmtree(self.tmp_dir)
             pass
@@ -252,4 +255,29 @@ class TestFindFindAttCMax(unittest.TestCase):
                            )
         exp = exp.astype(dtype=self.max_dtype)
 
-        pdt.assert_frame_equal(max_final, exp)
\ No newline at end of file
+        pdt.assert_frame_equal(max_final, exp)
+
+
+    def test_find_attc_max_calin_overlap(self):
+        integron_finder.replicon_name = 'foo'
+        integron_finder.SIZE_REPLICON = 20000
+        integron_finder.circular = False
+        integron_finder.LOCAL_MAX_BATCH = 1
+        searched = []
+        attc = pd.DataFrame([['foo', 'attC_4', 1, 47, 5000, 5100, '+', 1e-5],
+                             ['foo', 'attC_4', 1, 47, 6000, 6100, '+', 1e-5]],
+                            columns=self.max_cols)
+
+        def fake_local_max(replicon_name, window_beg, window_end, strand_search="both", cpu=None, indexed=True):
+            searched.append((window_beg, window_end, strand_search))
+            return attc[(attc.pos_beg >= window_beg) & (attc.pos_end <= window_end)]
+
+        integron_finder.local_max = fake_local_max
+        calin_1 = Integron('foo')
+        calin_1.add_attC(5000, 5100, 1, 1e-5, "attc_4")
+        calin_2 = Integron('foo')
+        calin_2.add_attC(6000, 6100, 1, 1e-5, "attc_4")
+        max_final = integron_finder.find_attc_max([calin_1, calin_2])
+        self.assertEqual(max_final.pos_beg.tolist(), [5000, 6000])
+        # the second CALIN was found by the search around the first one, its window is not searched
+        self.assertEqual(searched, [(1000, 9100, 'top'), (8900, 13100, 'top')])
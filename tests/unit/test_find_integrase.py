@@ -73,8 +73,8 @@ class TestFindIntegrase(unittest.TestCase):
 
 
     def test_find_integrase_gembase(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(True)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
 
         replicon_name = 'acba.007.p01.13'
         replicon_path = os.path.join(self._data_dir, 'Replicons', replicon_name + '.fst')
@@ -84,14 +84,146 @@ class TestFindIntegrase(unittest.TestCase):
                         integron_finder.PROT_file)
 
         integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
-        for suffix in ('_intI.res', '_intI_table.res', '_phage_int.res', '_phage_int_table.res'):
+        for suffix in ('_intI.res', '_intI_table.res', '_intI_domtbl.res',
+                       '_phage_int.res', '_phage_int_table.res', '_phage_int_domtbl.res'):
             res = os.path.join(self.tmp_dir, replicon_name + suffix)
             self.assertTrue(os.path.exists(res))
 
 
+    def test_find_integrase_phage_no_candidate(self):
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
+        # hmmsearch must not be run
+        integron_finder.HMMSEARCH = 'foo'
+
+        replicon_name = 'acba.007.p01.13'
+        replicon_path = os.path.join(self._data_dir, 'Replicons', replicon_name + '.fst')
+
+        integron_finder.PROT_file = os.path.join(self.tmp_dir, replicon_name + ".prt")
+        shutil.copyfile(os.path.join(self._data_dir, 'Proteins', replicon_name + ".prt"),
+                        integron_finder.PROT_file)
+        # the integron integrase profile did not hit any protein
+        integron_finder.write_empty_hmm_outputs([os.path.join(self.tmp_dir, replicon_name + suffix)
+                                                 for suffix in ('_intI.res', '_intI_table.res', '_intI_domtbl.res')],
+                                                "no hit")
+
+        integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
+        for suffix in ('_phage_int.res', '_phage_int_table.res', '_phage_int_domtbl.res'):
+            res = os.path.join(self.tmp_dir, replicon_name + suffix)
+            self.assertTrue(os.path.exists(res))
+        phage = integron_finder.read_hmm(replicon_name,
+                                         os.path.join(self.tmp_dir, replicon_name + '_phage_int_domtbl.res'))
+        self.assertTrue(phage.empty)
+
+
+    def test_find_integrase_union_after_default(self):
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
+
+        replicon_name = 'acba.007.p01.13'
+        replicon_path = os.path.join(self._data_dir, 'Replicons', replicon_name + '.fst')
+        integrases = os.path.join(self._data_dir, 'integrases')
+        other = os.path.join(self._data_dir, 'Results_Integron_Finder_acba.007.p01.13', 'other')
+
+        integron_finder.PROT_file = os.path.join(self.tmp_dir, replicon_name + ".prt")
+        shutil.copyfile(os.path.join(self._data_dir, 'Proteins', replicon_name + ".prt"),
+                        integron_finder.PROT_file)
+        # the integron integrase profile was already searched
+        shutil.copyfile(os.path.join(other, replicon_name + '_intI.res'),
+                        os.path.join(self.tmp_dir, replicon_name + '_intI.res'))
+        shutil.copyfile(os.path.join(integrases, replicon_name + '_intI_domtbl.res'),
+                        os.path.join(self.tmp_dir, replicon_name + '_intI_domtbl.res'))
+
+        searched = []
+        def fake_hmmsearch(cmd, **kwargs):
+            # write the outputs of the phage integrase profile
+            searched.append(cmd[-1])
+            for option, suffix in (('-o', '_phage_int.res'), ('--tblout', '_phage_int_table.res'),
+                                   ('--domtblout', '_phage_int_domtbl.res')):
+                shutil.copyfile(os.path.join(integrases if option != '-o' else other, replicon_name + suffix),
+                                cmd[cmd.index(option) + 1])
+            return 0
+        integron_finder.call = fake_hmmsearch
+
+        phage_out = os.path.join(self.tmp_dir, replicon_name + '_phage_int.res')
+        integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
+        self.assertEqual(len(searched), 1)
+        self.assertNotEqual(searched[0], integron_finder.PROT_file)
+        self.assertTrue(integron_finder.intI_candidates_only(phage_out))
+
+        # the phage integrase profile must be searched again against all the proteins
+        integron_finder.args = FakeArgs(True, True)
+        integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
+        self.assertEqual(searched[1:], [integron_finder.PROT_file])
+        self.assertFalse(integron_finder.intI_candidates_only(phage_out))
+
+        # the outputs of all the proteins are reused
+        integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
+        self.assertEqual(len(searched), 2)
+
+
+    def test_split_hmm_outputs(self):
+        other = os.path.join(self._data_dir, 'Results_Integron_Finder_acba.007.p01.13', 'other')
+        models = [integron_finder.MODEL_integrase, integron_finder.MODEL_phage_int]
+        # the outputs of a search with both profiles
+        combined = [os.path.join(self.tmp_dir, 'integrases' + suffix)
+                    for suffix in ('.res', '_table.res', '_domtbl.res')]
+        for path, suffixes in zip(combined[:2], (('_intI.res', '_phage_int.res'),
+                                                 ('_intI_table.res', '_phage_int_table.res'))):
+            with open(path, 'w') as out:
+                for suffix in suffixes:
+                    with open(os.path.join(other, 'acba.007.p01.13' + suffix)) as res:
+                        out.write(res.read())
+        with open(combined[2], 'w') as out:
+            out.write(integron_finder.DOMTBL_HEADER)
+            out.write("ACBA.007.P01_13_1 - 337 intI_Cterm - 84 1e-20 70.1 0.1 1 1 2e-23 1e-20 69.5 0.1 "
+                      "1 84 150 236 147 240 0.95 -\n")
+            out.write("ACBA.007.P01_13_1 - 337 Phage_integrase - 173 2e-47 160.9 0.0 1 1 3e-50 2e-47 160.3 0.0 "
+                      "1 172 148 328 148 329 0.94 -\n")
+        outputs_by_file = [[os.path.join(self.tmp_dir, name + suffix)
+                            for suffix in ('.res', '_table.res', '_domtbl.res')] for name in ('intI', 'phage_int')]
+
+        integron_finder.split_hmm_outputs(models, combined, outputs_by_file)
+        for outputs, query in zip(outputs_by_file, ('intI_Cterm', 'Phage_integrase')):
+            with open(outputs[0]) as hmm_out:
+                self.assertEqual([line.split()[1] for line in hmm_out if line.startswith('Query:')], [query])
+            for col, query_field in ((1, 2), (2, 3)):
+                with open(outputs[col]) as table:
+                    hits = [line.split()[query_field] for line in table if not line.startswith('#')]
+                self.assertTrue(hits)
+                self.assertEqual(set(hits), set([query]))
+
+
+    def test_split_hmm_outputs_real(self):
+        # the tables of one search with both profiles and of a search with each profile
+        # (acba.007.p01.13 proteins, see tests/data/integrases)
+        integrases = os.path.join(self._data_dir, 'integrases')
+        other = os.path.join(self._data_dir, 'Results_Integron_Finder_acba.007.p01.13', 'other')
+        models = [integron_finder.MODEL_integrase, integron_finder.MODEL_phage_int]
+        combined = [os.path.join(self.tmp_dir, 'integrases.res'),
+                    os.path.join(integrases, 'acba.007.p01.13_integrases_table.res'),
+                    os.path.join(integrases, 'acba.007.p01.13_integrases_domtbl.res')]
+        with open(combined[0], 'w') as out:
+            for suffix in ('_intI.res', '_phage_int.res'):
+                with open(os.path.join(other, 'acba.007.p01.13' + suffix)) as res:
+                    out.write(res.read())
+        outputs_by_file = [[os.path.join(self.tmp_dir, name + suffix)
+                            for suffix in ('.res', '_table.res', '_domtbl.res')] for name in ('intI', 'phage_int')]
+
+        integron_finder.split_hmm_outputs(models, combined, outputs_by_file)
+        for outputs, name in zip(outputs_by_file, ('intI', 'phage_int')):
+            for output, suffix in zip(outputs[1:], ('_table.res', '_domtbl.res')):
+                with open(output) as table:
+                    hits = [line for line in table if not line.startswith('#')]
+                with open(os.path.join(integrases, 'acba.007.p01.13_' + name + suffix)) as table:
+                    expected = [line for line in table if not line.startswith('#')]
+                self.assertTrue(expected)
+                self.assertEqual(hits, expected)
+
+
     def test_find_integrase_no_gembase_with_protfile(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(False)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(False, False)
         integron_finder.SIZE_REPLICON = 200
 
         replicon_name = 'acba.007.p01.13'
@@ -102,14 +234,15 @@ class TestFindIntegrase(unittest.TestCase):
                         integron_finder.PROT_file)
 
         integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
-        for suffix in ('_intI.res', '_intI_table.res','_phage_int.res', '_phage_int_table.res'):
+        for suffix in ('_intI.res', '_intI_table.res', '_intI_domtbl.res',
+                       '_phage_int.res', '_phage_int_table.res', '_phage_int_domtbl.res'):
             res = os.path.join(self.tmp_dir, replicon_name + suffix)
             self.assertTrue(os.path.exists(res))
 
 
     def test_find_integrase_no_gembase_no_protfile_short_seq(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(False)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(False, False)
         integron_finder.SIZE_REPLICON = 200
 
         replicon_name = 'acba.007.p01.13'
@@ -118,14 +251,15 @@ class TestFindIntegrase(unittest.TestCase):
         integron_finder.PROT_file = os.path.join(self.tmp_dir, replicon_name + ".prt")
 
         integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
-        for suffix in ('_intI.res', '_intI_table.res','_phage_int.res', '_phage_int_table.res'):
+        for suffix in ('_intI.res', '_intI_table.res', '_intI_domtbl.res',
+                       '_phage_int.res', '_phage_int_table.res', '_phage_int_domtbl.res'):
             res = os.path.join(self.tmp_dir, replicon_name + suffix)
             self.assertTrue(os.path.exists(res))
 
 
     def test_find_integrase_no_gembase_no_protfile_long_seq(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(False)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(False, False)
         integron_finder.SIZE_REPLICON = 500000
 
         replicon_name = 'acba.007.p01.13'
@@ -133,14 +267,15 @@ class TestFindIntegrase(unittest.TestCase):
 
         integron_finder.PROT_file = os.path.join(self.tmp_dir, replicon_name + ".prt")
         integron_finder.find_integrase(replicon_path, replicon_name, self.tmp_dir)
-        for suffix in ('_intI.res', '_intI_table.res','_phage_int.res', '_phage_int_table.res'):
+        for suffix in ('_intI.res', '_intI_table.res', '_intI_domtbl.res',
+                       '_phage_int.res', '_phage_int_table.res', '_phage_int_domtbl.res'):
             res = os.path.join(self.tmp_dir, replicon_name + suffix)
             self.assertTrue(os.path.exists(res))
 
 
     def test_find_integrase_no_gembase_no_protfile_no_prodigal(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(False)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(False, False)
         integron_finder.SIZE_REPLICON = 500000
 
         replicon_name = 'acba.007.p01.13'
@@ -153,8 +288,8 @@ class TestFindIntegrase(unittest.TestCase):
 
 
     def test_find_integrase_no_gembase_no_protfile_no_replicon(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(False)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(False, False)
         integron_finder.SIZE_REPLICON = 500000
 
         replicon_name = 'acba.007.p01.13'
@@ -165,8 +300,8 @@ class TestFindIntegrase(unittest.TestCase):
 
 
     def test_find_integrase_gembase_no_hmmer(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(True)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
         integron_finder.HMMSEARCH = 'foo'
 
         replicon_name = 'acba.007.p01.13'
@@ -182,8 +317,8 @@ class TestFindIntegrase(unittest.TestCase):
 
 
     def test_find_integrase_gembase_no_hmmer(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(True)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
         integron_finder.HMMSEARCH = 'foo'
 
         replicon_name = 'acba.007.p01.13'
@@ -199,8 +334,8 @@ class TestFindIntegrase(unittest.TestCase):
 
 
     def test_find_integrase_gembase_hmmer_error(self):
-        FakeArgs = namedtuple('FakeArgs', 'gembase')
-        integron_finder.args = FakeArgs(True)
+        FakeArgs = namedtuple('FakeArgs', 'gembase union_integrases')
+        integron_finder.args = FakeArgs(True, False)
         integron_finder.N_CPU = 'foo'
 
         replicon_name = 'acba.007.p01.13'
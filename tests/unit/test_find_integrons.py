@@ -51,13 +51,13 @@ class TestFindIntegons(unittest.TestCase):
         integron_finder.MODEL_attc = os.path.join(self.integron_home, 'data', 'Models', 'attc_4.cm')
 
         self.columns = ['pos_beg', 'pos_end', 'strand', 'evalue', 'type_elt', 'model', 'distance_2attC', 'annotation']
-        self.dtype = {"pos_beg": 'int',
-                      "pos_end": 'int',
-                      "strand": 'int',
+        self.dtype = {"pos_beg": 'int32',
+                      "pos_end": 'int32',
+                      "strand": 'int8',
                       "evalue": 'float',
                       "type_elt": 'str',
-                      "annotation": 'str',
-                      "model": 'str',
+                      "annotation": 'category',
+                      "model": 'category',
                       "distance_2attC": 'float'}
 
     def tearDown(self):
@@ -133,6 +133,7 @@ class TestFindIntegons(unittest.TestCase):
                             'type_elt': 'attC'},
                            columns=self.columns,
                            index=['attc_001', 'attc_002', 'attc_003'])
+        exp = exp.astype(dtype=self.dtype)
         pdt.assert_frame_equal(integron.attC, exp)
 
         exp = pd.DataFrame(columns=self.columns,)
@@ -201,6 +202,7 @@ class TestFindIntegons(unittest.TestCase):
                             'type_elt': 'attC'},
                            columns=self.columns,
                            index=['attc_001', 'attc_002', 'attc_003'])
+        exp = exp.astype(dtype=self.dtype)
         pdt.assert_frame_equal(integron.attC, exp)
 
         exp = pd.DataFrame(columns=self.columns)
@@ -368,3 +370,22 @@ class TestFindIntegons(unittest.TestCase):
         pdt.assert_frame_equal(integron.promoter, exp)
         pdt.assert_frame_equal(integron.attI, exp)
         pdt.assert_frame_equal(integron.proteins, exp)
+
+
+    def test_assign_attc_arrays(self):
+        integron_finder.SIZE_REPLICON = 20000
+        integron_finder.DISTANCE_THRESHOLD = 4000
+        int_beg = np.array([2500, 9000, 15000, 19500])
+        int_end = np.array([3000, 10000, 16000, 19900])
+        attc_left = np.array([3100, 7000, 500, 10600])
+        attc_right = np.array([5000, 8500, 900, 10700])
+        # the first integrase takes the array on its left (attC after it) at 100 bp,
+        # the second one the array on its right at 500 bp, the third one is too far from the last array,
+        # the fourth one takes the array over the origin
+        self.assertEqual(integron_finder.assign_attc_arrays(int_beg, int_end, attc_left, attc_right),
+                         [0, 1, None, 2])
+        # an array is taken once
+        self.assertEqual(integron_finder.assign_attc_arrays(int_beg[:1], int_end[:1],
+                                                            attc_left[:1], attc_right[:1]), [0])
+        self.assertEqual(integron_finder.assign_attc_arrays(np.array([2500, 2600]), np.array([3000, 3050]),
+                                                            attc_left[:1], attc_right[:1]), [0, None])
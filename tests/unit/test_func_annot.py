@@ -45,16 +45,18 @@ class TestFunctions(unittest.TestCase):
         self.exp_files = ["acba.007.p01.13.prt", "acba.007.p01.13_Resfams_fa_table.res",
                           "acba.007.p01.13_intI_table.res", "acba.007.p01.13_phage_int_table.res",
                           "acba.007.p01.13_Resfams_fa.res", "acba.007.p01.13_intI.res",
-                          "acba.007.p01.13_phage_int.res", "acba.007.p01.13_subseqprot.tmp"]
+                          "acba.007.p01.13_phage_int.res", "acba.007.p01.13_subseqprot.tmp",
+                          "acba.007.p01.13_Resfams_fa_domtbl.res", "acba.007.p01.13_intI_domtbl.res",
+                          "acba.007.p01.13_phage_int_domtbl.res"]
         self.exp_files = [os.path.join(self.out_dir, file) for file in self.exp_files]
 
-        self.prot_dtype = {"pos_beg": 'int',
-                           "pos_end": 'int',
-                           "strand": 'int',
+        self.prot_dtype = {"pos_beg": 'int32',
+                           "pos_end": 'int32',
+                           "strand": 'int8',
                            "evalue": 'float',
                            "type_elt": 'str',
-                           "annotation": 'str',
-                           "model": 'str',
+                           "annotation": 'category',
+                           "model": 'category',
                            "distance_2attC": 'float'}
 
         # Run prodigal to find CDS on replicon (and run hmmsearch on integrase (2 profiles))
@@ -114,6 +116,64 @@ class TestFunctions(unittest.TestCase):
                                               "RF0003", np.nan, "AAC3-I"]
         pdt.assert_frame_equal(proteins, integron1.proteins)
 
+    def test_annot_bank(self):
+        """
+        Test func_annot with a bank of several hmm files: they are searched at once, in one hmmsearch,
+        and each protein gets its best hit.
+        """
+        hmm_files = [os.path.join(self.out_dir, "Resfams_{}.hmm".format(i)) for i in range(2)]
+        for hmm in hmm_files:
+            shutil.copy(self.hmm_files[0], hmm)
+        integron1 = integron_finder.Integron(self.replicon_name)
+        integron_finder.integrons = [integron1]
+        integron1.add_attC(17825, 17884, -1, 7e-9, "attc_4")
+        integron1.add_attC(19080, 19149, -1, 7e-4, "attc_4")
+        integron1.add_attC(19618, 19726, -1, 7e-7, "attc_4")
+        integron1.add_proteins()
+
+        integron_finder.func_annot(self.replicon_name, self.out_dir, hmm_files)
+
+        for suffix in ["fa.res", "fa_table.res", "fa_domtbl.res"]:
+            self.assertTrue(os.path.isfile(os.path.join(self.out_dir,
+                                                        "acba.007.p01.13_func_annot_" + suffix)))
+        self.assertEqual(integron1.proteins.annotation.tolist(), ["emrE", "ANT3", "protein", "AAC3-I"])
+        self.assertEqual(integron1.proteins.model.tolist(), ["RF0066", "RF0027", "NA", "RF0003"])
+
+    def test_annot_batch(self):
+        """
+        Test func_annot_batch with 2 replicons having the same proteins: each distinct protein is
+        searched once, and the hits are given back to the integrons of both replicons.
+        """
+        found = []
+        for name in ["rep1", "rep2"]:
+            integron = integron_finder.Integron(name)
+            integron_finder.integrons = [integron]
+            integron.add_attC(17825, 17884, -1, 7e-9, "attc_4")
+            integron.add_attC(19080, 19149, -1, 7e-4, "attc_4")
+            integron.add_attC(19618, 19726, -1, 7e-7, "attc_4")
+            integron.add_proteins()
+            found.append((name, integron_finder.PROT_file, [integron]))
+
+        integron_finder.func_annot_batch(found, self.out_dir, "batch", self.hmm_files)
+
+        with open(os.path.join(self.out_dir, "batch_subseqprot.tmp")) as prot_file:
+            self.assertEqual(sum(1 for line in prot_file if line.startswith(">")), 4)
+        for _, _, (integron, ) in found:
+            self.assertEqual(integron.proteins.annotation.tolist(), ["emrE", "ANT3", "protein", "AAC3-I"])
+            self.assertEqual(integron.proteins.model.tolist(), ["RF0066", "RF0027", "NA", "RF0003"])
+
+        # the evalues of a search of the proteins of one replicon (up to the 2 significant digits of hmmer)
+        integron = integron_finder.Integron(self.replicon_name)
+        integron_finder.integrons = [integron]
+        integron.add_attC(17825, 17884, -1, 7e-9, "attc_4")
+        integron.add_attC(19080, 19149, -1, 7e-4, "attc_4")
+        integron.add_attC(19618, 19726, -1, 7e-7, "attc_4")
+        integron.add_proteins()
+        integron_finder.func_annot(self.replicon_name, self.out_dir, self.hmm_files)
+        for _, _, (batch_integron, ) in found:
+            np.testing.assert_allclose(batch_integron.proteins.evalue.values, integron.proteins.evalue.values,
+                                       rtol=0.1)
+
     def test_annot_calin_empty(self):
         """
         Test func_annot when the integron is a CALIN (attC but no integrase), without any protein:
@@ -131,9 +191,9 @@ class TestFunctions(unittest.TestCase):
         proteins = pd.DataFrame(columns=["pos_beg", "pos_end", "strand",
                                          "evalue", "type_elt", "model",
                                          "distance_2attC", "annotation"])
-        proteins = proteins.astype(dtype={"pos_beg": "int", "pos_end": "int", "strand": "int",
-                                          "evalue": "float", "type_elt": "str", "model": "str",
-                                          "distance_2attC": "float", "annotation": "str"})
+        proteins = proteins.astype(dtype={"pos_beg": "int32", "pos_end": "int32", "strand": "int8",
+                                          "evalue": "float", "type_elt": "str", "model": "category",
+                                          "distance_2attC": "float", "annotation": "category"})
         pdt.assert_frame_equal(proteins, integron1.proteins)
 
         # Annotate proteins
@@ -143,7 +203,8 @@ class TestFunctions(unittest.TestCase):
         files_created = glob.glob(os.path.join(self.out_dir, "*"))
         exp_files = ["acba.007.p01.13.prt", "acba.007.p01.13_intI_table.res",
                      "acba.007.p01.13_phage_int_table.res", "acba.007.p01.13_intI.res",
-                     "acba.007.p01.13_phage_int.res"]
+                     "acba.007.p01.13_phage_int.res", "acba.007.p01.13_intI_domtbl.res",
+                     "acba.007.p01.13_phage_int_domtbl.res"]
         exp_files = [os.path.join(self.out_dir, file) for file in exp_files]
         self.assertEqual(set(exp_files), set(files_created))
 
@@ -168,9 +229,9 @@ class TestFunctions(unittest.TestCase):
         proteins = pd.DataFrame(columns=["pos_beg", "pos_end", "strand",
                                          "evalue", "type_elt", "model",
                                          "distance_2attC", "annotation"])
-        proteins = proteins.astype(dtype={"pos_beg": "int", "pos_end": "int", "strand": "int",
-                                          "evalue": "float", "type_elt": "str", "model": "str",
-                                          "distance_2attC": "float", "annotation": "str"})
+        proteins = proteins.astype(dtype={"pos_beg": "int32", "pos_end": "int32", "strand": "int8",
+                                          "evalue": "float", "type_elt": "str", "model": "category",
+                                          "distance_2attC": "float", "annotation": "category"})
         pdt.assert_frame_equal(proteins, integron1.proteins)
 
         # Annotate proteins
@@ -179,7 +240,8 @@ class TestFunctions(unittest.TestCase):
         files_created = glob.glob(os.path.join(self.out_dir, "*"))
         exp_files = ["acba.007.p01.13.prt", "acba.007.p01.13_intI_table.res",
                      "acba.007.p01.13_phage_int_table.res", "acba.007.p01.13_intI.res",
-                     "acba.007.p01.13_phage_int.res"]
+                     "acba.007.p01.13_phage_int.res", "acba.007.p01.13_intI_domtbl.res",
+                     "acba.007.p01.13_phage_int_domtbl.res"]
         exp_files = [os.path.join(self.out_dir, file) for file in exp_files]
         self.assertEqual(set(exp_files), set(files_created))
         # check proteins after annotation
@@ -227,9 +289,9 @@ class TestFunctions(unittest.TestCase):
         proteins1 = pd.DataFrame(columns=["pos_beg", "pos_end", "strand",
                                           "evalue", "type_elt", "model",
                                           "distance_2attC", "annotation"])
-        proteins1 = proteins1.astype(dtype={"pos_beg": "int", "pos_end": "int", "strand": "int",
-                                          "evalue": "float", "type_elt": "str", "model": "str",
-                                          "distance_2attC": "float", "annotation": "str"})
+        proteins1 = proteins1.astype(dtype={"pos_beg": "int32", "pos_end": "int32", "strand": "int8",
+                                          "evalue": "float", "type_elt": "str", "model": "category",
+                                          "distance_2attC": "float", "annotation": "category"})
         proteins1 = proteins1[["pos_beg", "pos_end", "strand", "evalue", "type_elt",
                                "model", "distance_2attC", "annotation"]]
         proteins1 = proteins1.astype(dtype=self.prot_dtype)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests HmmHitCache class and hmmsearch_cached function of integron_finder
+"""
+
+import os
+import sys
+import hashlib
+import tempfile
+import shutil
+import argparse
+import unittest
+
+from Bio import Seq
+from Bio.SeqRecord import SeqRecord
+
+import integron_finder
+
+
+class TestHmmHitCache(unittest.TestCase):
+
+    def setUp(self):
+        if 'INTEGRON_HOME' in os.environ:
+            self.integron_home = os.environ['INTEGRON_HOME']
+        else:
+            self.integron_home = os.path.normpath(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        # only used for its version in the key of the profiles
+        integron_finder.HMMSEARCH = sys.executable
+        integron_finder.N_CPU = "1"
+        integron_finder.args = argparse.Namespace()
+        integron_finder.args.gembase = False
+        self.model = os.path.join(self.integron_home, 'data', 'Models', 'integron_integrase.hmm')
+        self.cache = integron_finder.HmmHitCache(os.path.join(self.tmp_dir, 'cache'))
+
+    def tearDown(self):
+        integron_finder.hmm_hit_cache = None
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+
+    def test_get_put(self):
+        key = self.cache.key([self.model])
+        fields = ["-", "337", "intI_Cterm", "-", "84", "1e-20", "70.1", "0.1", "1", "1",
+                  "2e-23", "1e-20", "69.5", "0.1", "1", "84", "150", "236", "147", "240", "0.95"]
+        self.assertEqual(self.cache.get(key, ["foo", "bar"]), {})
+        self.cache.put(key, {"foo": [fields], "bar": []})
+        # the proteins without hit are stored
+        self.assertEqual(self.cache.get(key, ["foo", "bar", "baz"]), {"foo": [fields], "bar": []})
+        # the cache is persistent
+        cache = integron_finder.HmmHitCache(os.path.join(self.tmp_dir, 'cache'))
+        self.assertEqual(cache.get(key, ["foo"]), {"foo": [fields]})
+        self.assertEqual(cache.get(cache.key([self.model, self.model]), ["foo"]), {})
+
+
+    def test_hmmsearch_cached(self):
+        integron_finder.hmm_hit_cache = self.cache
+        prots = [SeqRecord(Seq.Seq("MKTAYIAKQR"), id="prot_1", description="prot_1 # 55 # 1014 # 1 # ID=1_1"),
+                 SeqRecord(Seq.Seq("MSEQNNTEMT"), id="prot_2", description="prot_2 # 1100 # 1500 # -1 # ID=1_2"),
+                 SeqRecord(Seq.Seq("MKTAYIAKQR"), id="prot_3", description="prot_3 # 1600 # 2559 # 1 # ID=1_3")]
+        key = self.cache.key([self.model])
+        fields = ["-", "337", "intI_Cterm", "-", "84", "1e-20", "70.1", "0.1", "1", "1",
+                  "2e-23", "1e-20", "69.5", "0.1", "1", "84", "150", "236", "147", "240", "0.95"]
+        self.cache.put(key, {hashlib.sha1("MKTAYIAKQR").hexdigest(): [fields],
+                             hashlib.sha1("MSEQNNTEMT").hexdigest(): []})
+        outputs = [os.path.join(self.tmp_dir, name) for name in ("intI.res", "intI_table.res", "intI_domtbl.res")]
+        # all the proteins are in the cache, hmmsearch is not run
+        integron_finder.hmmsearch_cached([self.model], prots, 100, None, outputs)
+        self.assertTrue(all(os.path.isfile(path) for path in outputs))
+
+        hmm = integron_finder.read_hmm("foo", outputs[2])
+        self.assertEqual(hmm.ID_prot.tolist(), ["prot_1", "prot_3"])
+        self.assertEqual(hmm.pos_beg.tolist(), [55, 1600])
+        # the evalues of the domains are computed with the 2 proteins reported
+        self.assertEqual(hmm.evalue.tolist(), [2e-20, 2e-20])
+
+        integron_finder.hmmsearch_cached([self.model], prots, 100, 10, outputs)
+        self.assertEqual(integron_finder.read_hmm("foo", outputs[2]).evalue.tolist(), [1e-19, 1e-19])
@@ -31,13 +31,13 @@ class Test(unittest.TestCase):
             self.integron_home = os.path.normpath(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
         self.columns = ['pos_beg', 'pos_end', 'strand', 'evalue', 'type_elt', 'model', 'distance_2attC', 'annotation']
-        self.dtype = {"pos_beg": 'int',
-                      "pos_end": 'int',
-                      "strand": 'int',
+        self.dtype = {"pos_beg": 'int32',
+                      "pos_end": 'int32',
+                      "strand": 'int8',
                       "evalue": 'float',
                       "type_elt": 'str',
-                      "annotation": 'str',
-                      "model": 'str',
+                      "annotation": 'category',
+                      "model": 'category',
                       "distance_2attC": 'float'}
 
 
@@ -125,6 +125,37 @@ class Test(unittest.TestCase):
         pdt.assert_frame_equal(attc, integron.attC)
 
 
+    def test_add_attc_array(self):
+        integron_finder.SIZE_REPLICON = 1000
+        pos_beg = [10, 200, 950]
+        pos_end = [100, 300, 5]
+        evalue = [1.1e-07, 1e-05, 1e-03]
+
+        exp_integron = Integron("foo")
+        for beg, end, e in zip(pos_beg, pos_end, evalue):
+            exp_integron.add_attC(beg, end, -1, e, "attc_4")
+
+        integron = Integron("foo")
+        integron.add_attC_array(np.array(pos_beg[:2]), np.array(pos_end[:2]), np.array([-1, -1]),
+                                np.array(evalue[:2]), "attc_4")
+        # the elements can be added after the DataFrame has been built
+        self.assertEqual(integron.attC.distance_2attC.values[1], 100)
+        integron.add_attC_array(pos_beg[2:], pos_end[2:], [-1], evalue[2:], "attc_4")
+        pdt.assert_frame_equal(exp_integron.attC, integron.attC)
+        self.assertEqual(integron.attC.index.tolist(), ['attc_001', 'attc_002', 'attc_003'])
+        self.assertEqual(integron.attC.distance_2attC.values[2], 650)
+
+
+    def test_set_elements(self):
+        integron = Integron("foo")
+        integron.add_integrase(55, 1014, "foo_1", 1, 1e-25, "intI")
+        integrase = integron.integrase.copy()
+        integrase.loc["foo_1", "evalue"] = 1e-30
+        integron.integrase = integrase
+        self.assertIs(integron.integrase, integrase)
+        self.assertEqual(integron.type(), "In0")
+
+
     def test_type(self):
         no_integrase = Integron("foo")
         self.assertIsNone(no_integrase.type())
@@ -161,6 +192,46 @@ class Test(unittest.TestCase):
         self.assertEqual(one_integrase_one_attC.type(), "complete")
 
 
+    def test_geometry(self):
+        integron_finder.SIZE_REPLICON = 10000
+        integron = Integron("foo")
+        self.assertIsNone(integron.span)
+        integron.add_attC(2000, 2100, -1, 1e-5, "attc_4")
+        integron.add_attC(2500, 2600, -1, 1e-5, "attc_4")
+        self.assertEqual(integron.type(), "CALIN")
+        self.assertEqual(integron.attC_span, (2000, 2600))
+        self.assertEqual(integron.attC_strand, -1)
+        self.assertEqual(integron.span, (2000, 2600))
+        self.assertIsNone(integron.integrase_is_left)
+
+        # the summary is updated when elements are added
+        integron.add_integrase(9500, 9900, "foo_1", 1, 1e-25, "intI")
+        self.assertEqual(integron.type(), "complete")
+        self.assertEqual(integron.integrase_span, (9500, 9900))
+        self.assertTrue(integron.integrase_is_left)
+        self.assertEqual(integron.span, (9900, 2000))
+
+        # or when they are replaced
+        integrase = integron.integrase.copy()
+        integrase.loc["foo_1", ["pos_beg", "pos_end"]] = [3000, 3400]
+        integron.integrase = integrase
+        self.assertFalse(integron.integrase_is_left)
+        self.assertEqual(integron.span, (2600, 3000))
+
+        # at the same distance of both ends of the array, the integrase is on the right
+        integrase = integron.integrase.copy()
+        integrase.loc["foo_1", ["pos_beg", "pos_end"]] = [1700, 2900]
+        integron.integrase = integrase
+        self.assertFalse(integron.integrase_is_left)
+
+        # reading the elements keeps the summary
+        summary = integron._geometry
+        integron.attC
+        integron.integrase
+        self.assertEqual(integron.type(), "complete")
+        self.assertIs(integron._geometry, summary)
+
+
     def test_add_promoter(self):
         replicon_name = 'saen.040.p01.10'
         replicon_path = os.path.join(self._data_dir, "Replicons", replicon_name + '.fst')
@@ -423,6 +494,9 @@ class Test(unittest.TestCase):
         proteins = proteins.astype(dtype=self.dtype)
 
         excp_description = pd.concat([integrase, attC, promoter, attI, proteins], ignore_index=False)
+        # the description has the default types of pandas
+        excp_description = excp_description.astype(dtype={"pos_beg": int, "pos_end": int, "strand": int,
+                                                          "model": object, "annotation": object})
         excp_description = excp_description.reset_index()
         excp_description.columns = ["element"] + list(excp_description.columns[1:])
         excp_description["type"] = "complete"
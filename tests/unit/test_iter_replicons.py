@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests iter_replicons function of integron_finder
+"""
+
+import os
+import tempfile
+import shutil
+import unittest
+
+from Bio import SeqIO
+
+import integron_finder
+
+
+class TestIterReplicons(unittest.TestCase):
+
+    _data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', "data"))
+
+    def setUp(self):
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        self.replicons = ['acba.007.p01.13', 'lian.001.c02.10']
+
+    def tearDown(self):
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+
+    def test_one_replicon(self):
+        replicon_path = os.path.join(self._data_dir, 'Replicons', 'acba.007.p01.13.fst')
+        replicons = list(integron_finder.iter_replicons(replicon_path))
+        self.assertEqual(len(replicons), 1)
+        path, name, seq = replicons[0]
+        self.assertEqual(path, replicon_path)
+        self.assertEqual(name, 'acba.007.p01.13')
+        self.assertEqual(len(seq), 20301)
+
+
+    def test_multi_fasta(self):
+        multi_path = os.path.join(self.tmp_dir, 'multi.fst')
+        records = [SeqIO.read(os.path.join(self._data_dir, 'Replicons', r + '.fst'), 'fasta')
+                   for r in self.replicons]
+        SeqIO.write(records, multi_path, 'fasta')
+
+        replicons = list(integron_finder.iter_replicons(multi_path))
+        self.assertEqual([r[0] for r in replicons], [None, None])
+        self.assertEqual([r[1] for r in replicons], [rec.id for rec in records])
+        self.assertEqual([str(r[2].seq) for r in replicons], [str(rec.seq) for rec in records])
+
+
+    def test_multi_fasta_path_in_id(self):
+        multi_path = os.path.join(self.tmp_dir, 'multi.fst')
+        records = [SeqIO.read(os.path.join(self._data_dir, 'Replicons', r + '.fst'), 'fasta')
+                   for r in self.replicons]
+        records[0].id = 'gi|123|ref|NC_000913.3|/data/acba'
+        SeqIO.write(records, multi_path, 'fasta')
+
+        replicons = list(integron_finder.iter_replicons(multi_path))
+        self.assertEqual([r[1] for r in replicons], ['gi|123|ref|NC_000913.3|_data_acba', records[1].id])
+        self.assertEqual(integron_finder.scan_replicons(multi_path),
+                         [(multi_path, records[0].id, 'gi|123|ref|NC_000913.3|_data_acba', len(records[0])),
+                          (multi_path, records[1].id, records[1].id, len(records[1]))])
+
+
+    def test_directory(self):
+        for r in self.replicons:
+            shutil.copy(os.path.join(self._data_dir, 'Replicons', r + '.fst'), self.tmp_dir)
+        open(os.path.join(self.tmp_dir, 'README'), 'w').close()
+
+        replicons = list(integron_finder.iter_replicons(self.tmp_dir))
+        self.assertEqual([r[1] for r in replicons], self.replicons)
+        self.assertEqual([r[0] for r in replicons],
+                         [os.path.join(self.tmp_dir, r + '.fst') for r in self.replicons])
+
+
+    def test_scan_replicons(self):
+        multi_path = os.path.join(self.tmp_dir, 'multi.fst')
+        records = [SeqIO.read(os.path.join(self._data_dir, 'Replicons', r + '.fst'), 'fasta')
+                   for r in self.replicons]
+        SeqIO.write(records, multi_path, 'fasta')
+        shutil.copy(os.path.join(self._data_dir, 'Replicons', 'acba.007.p01.13.fst'), self.tmp_dir)
+
+        replicons = integron_finder.scan_replicons(self.tmp_dir)
+        acba_path = os.path.join(self.tmp_dir, 'acba.007.p01.13.fst')
+        self.assertEqual(replicons,
+                         [(acba_path, None, 'acba.007.p01.13', 20301)] +
+                         [(multi_path, rec.id, rec.id, len(rec)) for rec in records])
+
+
+    def test_wrong_path(self):
+        with self.assertRaises(IOError) as ctx:
+            list(integron_finder.iter_replicons('foo'))
+        self.assertEqual(str(ctx.exception), "{} no such file or directory".format(os.path.abspath('foo')))
@@ -250,7 +250,7 @@ class TestLocalMax(unittest.TestCase):
         self.assertEqual(ctx.exception.message,
                          "{} failed : [Errno 2] No such file or directory".format(integron_finder.CMSEARCH))
 
-        integron_finder.call = lambda x: 1
+        integron_finder.call = lambda x, **kwargs: 1
         with self.assertRaises(RuntimeError) as ctx:
             _ = integron_finder.local_max(integron_finder.replicon_name,
                                           win_beg, win_end,
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests local_max_batch function of integron_finder
+"""
+
+import os
+import tempfile
+import shutil
+import unittest
+
+from Bio import SeqIO, Seq
+import pandas as pd
+import pandas.util.testing as pdt
+
+import integron_finder
+_call_ori = integron_finder.call
+_local_max_batch_ori = integron_finder.local_max_batch
+
+
+class TestLocalMaxBatch(unittest.TestCase):
+
+    _data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', "data"))
+
+    def setUp(self):
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        integron_finder.replicon_name = 'acba.007.p01.13'
+        replicon_path = os.path.join(self._data_dir, 'Replicons', integron_finder.replicon_name + '.fst')
+        integron_finder.SEQUENCE = SeqIO.read(replicon_path, "fasta", alphabet=Seq.IUPAC.unambiguous_dna)
+        integron_finder.SIZE_REPLICON = len(integron_finder.SEQUENCE)
+        integron_finder.out_dir = self.tmp_dir
+        integron_finder.N_CPU = '2'
+        integron_finder.CMSEARCH = 'cmsearch'
+        integron_finder.MODEL_attc = 'attc_4.cm'
+        integron_finder.evalue_attc = 1.
+        integron_finder.max_attc_size = 200
+        integron_finder.min_attc_size = 40
+        integron_finder.length_cm = 47
+        self.cmsearch_calls = []
+
+        table = os.path.join(self._data_dir, 'Results_Integron_Finder_acba.007.p01.13', 'other',
+                             'acba.007.p01.13_attc_table.res')
+        with open(table) as f:
+            lines = f.readlines()
+        header, footer = lines[:2], lines[-10:]
+        # hit on the bottom strand at 17825..17884 on the replicon
+        hit = "{} - attC_4 - cm 1 47 {} {} - no 1 0.55 0.0 46.4 1e-09 ! -\n"
+
+        def fake_call(cmd, **kwargs):
+            self.cmsearch_calls.append(cmd)
+            infile = cmd[-1]
+            with open(cmd[cmd.index('--tblout') + 1], 'w') as tblout:
+                tblout.writelines(header)
+                for rec in SeqIO.parse(infile, 'fasta'):
+                    beg = int(rec.id.split('_')[0])
+                    if beg <= 17825 and 17884 <= beg + len(rec):
+                        tblout.write(hit.format(rec.id, 17884 - beg, 17825 - beg))
+                tblout.writelines(footer)
+            return 0
+
+        integron_finder.call = fake_call
+
+    def tearDown(self):
+        integron_finder.call = _call_ori
+        integron_finder.local_max_batch = _local_max_batch_ori
+        integron_finder.LOCAL_MAX_BATCH = 1
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+
+    def test_one_run_by_strand(self):
+        windows = [(13000, 17000, 'bottom'), (16800, 18900, 'bottom'), (18700, 1000, 'bottom'),
+                   (16800, 18900, 'top')]
+        res = integron_finder.local_max_batch('acba.007.p01.13', windows)
+        self.assertEqual(len(self.cmsearch_calls), 2)
+        for cmd in self.cmsearch_calls:
+            self.assertEqual(cmd[cmd.index('--cpu') + 1], '1')
+            self.assertIn('--max', cmd)
+        self.assertEqual(sorted(res.keys()), sorted(windows))
+        for window in windows:
+            exp_hits = 1 if window[:2] == (16800, 18900) else 0
+            self.assertEqual(len(res[window]), exp_hits)
+        hit = res[(16800, 18900, 'bottom')]
+        self.assertEqual(hit.pos_beg.values[0], 17825)
+        self.assertEqual(hit.pos_end.values[0], 17884)
+        self.assertEqual(hit.sens.values[0], '-')
+        self.assertEqual(hit.Accession_number.values[0], 'acba.007.p01.13')
+        pdt.assert_frame_equal(res[(16800, 18900, 'bottom')], res[(16800, 18900, 'top')])
+        # the batch fasta are removed
+        self.assertFalse([f for f in os.listdir(self.tmp_dir) if f.endswith('.fst')])
+
+
+    def test_same_as_local_max(self):
+        window = (16800, 18900, 'bottom')
+        res = integron_finder.local_max_batch('acba.007.p01.13', [window])
+        fake_call = integron_finder.call
+
+        def fake_single_call(cmd, **kwargs):
+            # local_max names the record after the replicon
+            rec = SeqIO.read(cmd[-1], 'fasta')
+            rec.id = "{}_{}".format(*window[:2])
+            SeqIO.write(rec, cmd[-1], 'fasta')
+            return fake_call(cmd)
+
+        integron_finder.call = fake_single_call
+        pdt.assert_frame_equal(res[window],
+                               integron_finder.local_max('acba.007.p01.13', *window))
+
+
+    def test_no_window(self):
+        self.assertEqual(integron_finder.local_max_batch('acba.007.p01.13', []), {})
+        self.assertEqual(self.cmsearch_calls, [])
+
+
+    def test_expand_lookahead(self):
+        integron_finder.circular = True
+        integron_finder.DISTANCE_THRESHOLD = 4000
+        integron_finder.LOCAL_MAX_BATCH = 3
+        batches = []
+        df_max = pd.DataFrame({'pos_beg': [1], 'pos_end': [100]})
+        empty = df_max.iloc[:0]
+
+        def fake_local_max_batch(replicon_name, windows):
+            batches.append(windows)
+            # only the first window has an attC, so the expansion stops after the second one
+            return {w: (df_max if i == 0 else empty) for i, w in enumerate(windows)}
+
+        integron_finder.local_max_batch = fake_local_max_batch
+        integron_finder.expand(1000, 5000, df_max, df_max, search_right=True)
+        self.assertEqual(batches, [[(4800, 9000, 'top'), (8800, 13000, 'top'), (12800, 17000, 'top')]])
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests local_max_windows function of integron_finder
+"""
+
+import unittest
+
+import pandas as pd
+
+import integron_finder
+_local_max_ori = integron_finder.local_max
+
+
+class TestLocalMaxWindows(unittest.TestCase):
+
+    def setUp(self):
+        integron_finder.SIZE_REPLICON = 20301
+        self.calls = []
+
+        def fake_local_max(replicon_name, window_beg, window_end, strand_search="both", cpu=None, indexed=True):
+            # the windows are searched whole, the index is filled once they are all searched
+            self.assertFalse(indexed)
+            self.calls.append((window_beg, window_end, strand_search, cpu))
+            return pd.DataFrame({'pos_beg': [window_beg], 'pos_end': [window_end], 'sens': [strand_search]})
+
+        integron_finder.local_max = fake_local_max
+
+    def tearDown(self):
+        integron_finder.local_max = _local_max_ori
+        integron_finder.searched_regions = None
+
+
+    def test_one_cpu(self):
+        integron_finder.N_CPU = '1'
+        windows = [(100, 4300, 'top'), (10000, 18000, 'bottom'), (19000, 2000, 'both')]
+        res = integron_finder.local_max_windows('foo', windows)
+        self.assertEqual(sorted(res.keys()), sorted(windows))
+        for (beg, end, strand), df in res.items():
+            self.assertEqual(df.pos_beg.values[0], beg)
+            self.assertEqual(df.sens.values[0], strand)
+        # biggest window first
+        self.assertEqual(self.calls, [(10000, 18000, 'bottom', '1'),
+                                      (100, 4300, 'top', '1'),
+                                      (19000, 2000, 'both', '1')])
+
+
+    def test_share_cpu(self):
+        integron_finder.N_CPU = '4'
+        windows = [(100, 4300, 'top'), (10000, 18000, 'bottom')]
+        res = integron_finder.local_max_windows('foo', windows)
+        self.assertEqual(sorted(res.keys()), sorted(windows))
+        self.assertEqual(sorted(self.calls), [(100, 4300, 'top', '2'), (10000, 18000, 'bottom', '2')])
+
+
+    def test_same_window_two_strands(self):
+        integron_finder.N_CPU = '4'
+        windows = [(100, 4300, 'top'), (100, 4300, 'bottom'), (100, 4300, 'top')]
+        res = integron_finder.local_max_windows('foo', windows)
+        self.assertEqual(sorted(res.keys()), [(100, 4300, 'bottom'), (100, 4300, 'top')])
+        # the second one is run after the first one with the default number of cpus
+        self.assertEqual(self.calls, [(100, 4300, 'top', '4'), (100, 4300, 'bottom', None)])
+
+
+    def test_no_window(self):
+        integron_finder.N_CPU = '4'
+        self.assertEqual(integron_finder.local_max_windows('foo', []), {})
+        self.assertEqual(self.calls, [])
+
+
+    def test_searched_regions(self):
+        integron_finder.N_CPU = '2'
+        integron_finder.searched_regions = integron_finder.SearchedRegions(20301)
+        windows = [(100, 4300, 'top'), (10000, 18000, 'bottom')]
+        integron_finder.local_max_windows('foo', windows)
+        for window in windows:
+            self.assertEqual(integron_finder.searched_regions.uncovered(*window), [])
+        self.assertEqual(integron_finder.searched_regions.uncovered(100, 4300, 'bottom'), [(100, 4300)])
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests MotifLibrary class and search_instances, search_motif, motif library functions of integron_finder
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import integron_finder
+
+
+class TestMotifs(unittest.TestCase):
+
+    def setUp(self):
+        if 'INTEGRON_HOME' in os.environ:
+            self.integron_home = os.environ['INTEGRON_HOME']
+        else:
+            self.integron_home = os.path.normpath(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+        integron_finder.MODEL_DIR = os.path.join(self.integron_home, "data", "Models")
+        integron_finder.MOTIF_MISMATCHES = 0
+        self.tmp_dir = tempfile.mkdtemp()
+
+
+    def tearDown(self):
+        integron_finder.MOTIF_MISMATCHES = 0
+        integron_finder.MOTIF_LIBRARY = None
+        integron_finder.MOTIF_INDEX_DIR = None
+        shutil.rmtree(self.tmp_dir)
+
+
+    def test_make_motif(self):
+        motif = integron_finder.make_motif("foo", ["AACGT", "AAGGT"])
+        self.assertEqual(motif.length, 5)
+        self.assertEqual(motif.reverse_instances, ["ACGTT", "ACCTT"])
+
+
+    def test_search_instances(self):
+        self.assertEqual(integron_finder.search_instances(["AAA", "AAT"], "AAAATAAT"), [0, 1, 2, 5])
+        self.assertEqual(integron_finder.search_instances(["AAA"], "aaaa"), [])
+        self.assertEqual(integron_finder.search_instances(["AAA"], "AA"), [])
+
+
+    def test_search_instances_mismatches(self):
+        hits = integron_finder.search_instances_mismatches(["ACGT", "TTTT"], "ACGAGTTTT", 1)
+        self.assertEqual(hits, [(0, 1), (4, 1), (5, 0)])
+        self.assertEqual(integron_finder.search_instances_mismatches(["ACGT"], "ACG", 1), [])
+
+
+    def test_search_motif(self):
+        motif = integron_finder.make_motif("foo", ["ACGT"])
+        hits = integron_finder.search_motif(motif, motif.instances, "TACGTACCT")
+        self.assertEqual([pos for pos, _ in hits], [1])
+        self.assertTrue(np.isnan(hits[0][1]))
+        integron_finder.MOTIF_MISMATCHES = 1
+        self.assertEqual(integron_finder.search_motif(motif, motif.instances, "TACGTACCT"),
+                         [(1, 0.0), (5, 1.0)])
+        # the number of mismatches of the motif overrides MOTIF_MISMATCHES
+        motif = integron_finder.make_motif("foo", ["ACGT"], max_mismatches=0)
+        self.assertEqual([pos for pos, _ in integron_finder.search_motif(motif, motif.instances, "TACGTACCT")],
+                         [1])
+
+
+    def test_motif_library(self):
+        library = integron_finder.motif_library()
+        self.assertIs(library, integron_finder.motif_library())
+        self.assertEqual([m.name for m in library.attI], ["attI1", "attI2", "attI3"])
+        self.assertEqual(library.promoters_cassettes[-1].name, "Pc_int3")
+        for motif in library.promoters_cassettes:
+            self.assertTrue(all(len(i) == motif.length for i in motif.instances))
+
+
+    def test_read_motif_library(self):
+        tsv = os.path.join(self.tmp_dir, "motifs.tsv")
+        with open(tsv, "w") as f:
+            f.write("# name\tclass\tstrand\tmax_mismatches\tsequence\n"
+                    "Pc_new1\tPc\tsame\t-\tacgtacgt\n"
+                    "Pc_new1\tPc\tsame\t-\tACGTACGA\n"
+                    "attI_new4\tattI\tboth\t1\tTTTTGGGG\n")
+        fasta = os.path.join(self.tmp_dir, "motifs.fst")
+        with open(fasta, "w") as f:
+            f.write(">Pc_new1 class=Pc\nACGTACGT\n>Pc_new1 class=Pc\nACGTACGA\n"
+                    ">attI_new4 class=attI strand=both max_mismatches=1\nTTTTGGGG\n")
+        exp = {"P_intI": [],
+               "Pc": [("Pc_new1", ["ACGTACGT", "ACGTACGA"], None, "same")],
+               "attI": [("attI_new4", ["TTTTGGGG"], 1, "both")]}
+        self.assertEqual(integron_finder.read_motif_library(tsv), exp)
+        self.assertEqual(integron_finder.read_motif_library(fasta), exp)
+
+        with open(tsv, "a") as f:
+            f.write("foo\tbar\tsame\t-\tACGT\n")
+        with self.assertRaises(RuntimeError):
+            integron_finder.read_motif_library(tsv)
+
+
+    def test_compile_motif_library(self):
+        tsv = os.path.join(self.tmp_dir, "motifs.tsv")
+        with open(tsv, "w") as f:
+            f.write("attI_new4\tattI\tboth\t1\tTTTTGGGG\n")
+        library = integron_finder.compile_motif_library(tsv, self.tmp_dir)
+        index_path = os.path.join(self.tmp_dir, "motifs", integron_finder.file_checksum(tsv) + ".pickle")
+        self.assertTrue(os.path.isfile(index_path))
+        self.assertEqual(library["attI"], [integron_finder.make_motif("attI_new4", ["TTTTGGGG"], 1, "both")])
+        self.assertEqual(integron_finder.compile_motif_library(tsv, self.tmp_dir), library)
+
+        integron_finder.MOTIF_LIBRARY = tsv
+        integron_finder.MOTIF_INDEX_DIR = self.tmp_dir
+        self.assertEqual([m.name for m in integron_finder.motif_library().attI],
+                         ["attI1", "attI2", "attI3", "attI_new4"])
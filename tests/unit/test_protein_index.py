@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests ProteinIndex class and protein_index function of integron_finder
+"""
+
+import os
+import argparse
+import unittest
+
+from Bio import SeqIO
+
+import integron_finder
+
+
+class TestProteinIndex(unittest.TestCase):
+
+    _data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', "data", "Proteins"))
+
+    def setUp(self):
+        self.prodigal_file = os.path.join(self._data_dir, 'acba.007.p01.13.prt')
+        self.gembase_file = os.path.join(self._data_dir, 'OBAL001.B.00005.C001.prt')
+
+
+    def test_prodigal(self):
+        index = integron_finder.ProteinIndex(self.prodigal_file, False)
+        prots = list(SeqIO.parse(self.prodigal_file, "fasta"))
+        self.assertEqual(len(index), 23)
+        self.assertEqual(index.ids, [p.id for p in prots])
+        self.assertEqual(index.pos_beg[2], 1722)
+        self.assertEqual(index.pos_end[2], 2537)
+        self.assertEqual(index.strand[2], -1)
+        self.assertEqual(str(index.record('ACBA.007.P01_13_3').seq), str(prots[2].seq))
+
+
+    def test_gembase(self):
+        index = integron_finder.ProteinIndex(self.gembase_file, True)
+        self.assertEqual(len(index), 2149)
+        self.assertEqual(index.ids[1], 'OBAL001.B.00005.C001_00004')
+        self.assertEqual(index.pos_beg[1], 4301)
+        self.assertEqual(index.pos_end[1], 5827)
+        self.assertEqual(index.strand[1], -1)
+
+
+    def test_records(self):
+        index = integron_finder.ProteinIndex(self.prodigal_file, False)
+        records = index.records(['ACBA.007.P01_13_5', 'ACBA.007.P01_13_2', 'foo'])
+        self.assertEqual([r.id for r in records], ['ACBA.007.P01_13_2', 'ACBA.007.P01_13_5'])
+
+
+    def test_protein_index(self):
+        integron_finder.args = argparse.Namespace()
+        integron_finder.args.gembase = False
+        integron_finder.PROT_file = self.prodigal_file
+        index = integron_finder.protein_index()
+        self.assertIs(index, integron_finder.protein_index())
+        integron_finder.PROT_file = self.gembase_file
+        integron_finder.args.gembase = True
+        self.assertEqual(len(integron_finder.protein_index()), 2149)
+
+
+    def test_select(self):
+        index = integron_finder.ProteinIndex(self.prodigal_file, False)
+        size = 20301
+        for debut, fin in [(1500, 5000), (-200, 1200), (19000, 900), (18000, 20501), (4000, 4000)]:
+            s_int = (fin - debut) % size
+            exp = [i for i in range(len(index))
+                   if (fin - index.pos_end[i]) % size < s_int or (index.pos_beg[i] - debut) % size < s_int]
+            self.assertEqual(index.select(debut, fin, size).tolist(), exp)
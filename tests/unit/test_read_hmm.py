@@ -36,10 +36,7 @@ class TestFunctions(unittest.TestCase):
         exp = pd.DataFrame(columns=["Accession_number", "query_name", "ID_query", "ID_prot",
                                     "strand", "pos_beg", "pos_end", "evalue"])
 
-        intcols = ["pos_beg", "pos_end", "strand"]
-        floatcol = ["evalue"]
-        exp[intcols] = exp[intcols].astype(int)
-        exp[floatcol] = exp[floatcol].astype(float)
+        exp = exp.astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df, exp)
 
     def test_read_hmm(self):
@@ -54,7 +51,7 @@ class TestFunctions(unittest.TestCase):
                                  "pos_beg": 55, "pos_end": 1014, "evalue": 1.9e-25},
                            index=[0])
         exp = exp[["Accession_number", "query_name", "ID_query", "ID_prot",
-                   "strand", "pos_beg", "pos_end", "evalue"]]
+                   "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df, exp)
 
     def test_read_hmm_gembase(self):
@@ -74,7 +71,7 @@ class TestFunctions(unittest.TestCase):
                                  "pos_beg": 55, "pos_end": 1014, "evalue": 1.9e-25},
                            index=[0])
         exp = exp[["Accession_number", "query_name", "ID_query", "ID_prot",
-                   "strand", "pos_beg", "pos_end", "evalue"]]
+                   "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df, exp)
 
     def test_read_hmm_evalue(self):
@@ -90,16 +87,13 @@ class TestFunctions(unittest.TestCase):
                                   "pos_beg": 55, "pos_end": 1014, "evalue": 1.9e-25},
                             index=[0])
         exp1 = exp1[["Accession_number", "query_name", "ID_query", "ID_prot",
-                     "strand", "pos_beg", "pos_end", "evalue"]]
+                     "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df1, exp1)
         df2 = integron_finder.read_hmm(self.rep_name, infile, evalue=1.9e-25)
         exp2 = pd.DataFrame(columns=["Accession_number", "query_name", "ID_query", "ID_prot",
                                      "strand", "pos_beg", "pos_end", "evalue"])
 
-        intcols = ["pos_beg", "pos_end", "strand"]
-        floatcol = ["evalue"]
-        exp2[intcols] = exp2[intcols].astype(int)
-        exp2[floatcol] = exp2[floatcol].astype(float)
+        exp2 = exp2.astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df2, exp2)
 
     def test_read_hmm_evalue2(self):
@@ -119,7 +113,7 @@ class TestFunctions(unittest.TestCase):
                                   "evalue": [1.9e-25, 2e-25]},
                             index=[0, 1])
         exp1 = exp1[["Accession_number", "query_name", "ID_query", "ID_prot",
-                     "strand", "pos_beg", "pos_end", "evalue"]]
+                     "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df1, exp1)
 
     def test_read_hmm_cov(self):
@@ -135,15 +129,12 @@ class TestFunctions(unittest.TestCase):
                                   "pos_beg": 55, "pos_end": 1014, "evalue": 1.9e-25},
                             index=[0])
         exp1 = exp1[["Accession_number", "query_name", "ID_query", "ID_prot",
-                     "strand", "pos_beg", "pos_end", "evalue"]]
+                     "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df1, exp1)
         df2 = integron_finder.read_hmm(self.rep_name, infile, coverage=0.95)
         exp2 = pd.DataFrame(columns=["Accession_number", "query_name", "ID_query", "ID_prot",
                                      "strand", "pos_beg", "pos_end", "evalue"])
-        intcols = ["pos_beg", "pos_end", "strand"]
-        floatcol = ["evalue"]
-        exp2[intcols] = exp2[intcols].astype(int)
-        exp2[floatcol] = exp2[floatcol].astype(float)
+        exp2 = exp2.astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df2, exp2)
 
     def test_read_hmm_cov2(self):
@@ -163,7 +154,7 @@ class TestFunctions(unittest.TestCase):
                                   "evalue": [1.9e-25, 1e-3]},
                             index=[0, 1])
         exp1 = exp1[["Accession_number", "query_name", "ID_query", "ID_prot",
-                     "strand", "pos_beg", "pos_end", "evalue"]]
+                     "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df1, exp1)
 
     def test_read_multi(self):
@@ -186,5 +177,29 @@ class TestFunctions(unittest.TestCase):
                                  "evalue": [4.5e-25, 2.3e-25]},
                            index=[0, 1])
         exp = exp[["Accession_number", "query_name", "ID_query", "ID_prot",
-                   "strand", "pos_beg", "pos_end", "evalue"]]
+                   "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
         pdt.assert_frame_equal(df, exp)
+
+    def test_read_domtblout(self):
+        """
+        Test that the hits of hmmsearch --domtblout output are well read: the domain with
+        the best i-evalue is kept for each hit, and the hits of all queries are returned.
+        """
+        infile = os.path.join("tests", "data", "fictive_results",
+                              self.rep_name + "_intI_domtbl.res")
+        df = integron_finder.read_hmm(self.rep_name, infile)
+        exp = pd.DataFrame(data={"Accession_number": [self.rep_name] * 3,
+                                 "query_name": ["intI_Cterm", "intI_Cterm", "Phage_integrase"],
+                                 "ID_query": ["-", "-", "PF00589.21"],
+                                 "ID_prot": ["ACBA.007.P01_13_1", "ACBA.007.P01_13_3", "ACBA.007.P01_13_1"],
+                                 "strand": [1, 1, 1],
+                                 "pos_beg": [55, 3000, 55], "pos_end": [1014, 3500, 1014],
+                                 "evalue": [1.9e-25, 2.0e-21, 2.9e-10]},
+                           index=[0, 1, 2])
+        exp = exp[["Accession_number", "query_name", "ID_query", "ID_prot",
+                   "strand", "pos_beg", "pos_end", "evalue"]].astype(dtype=integron_finder.HMM_DTYPE)
+        pdt.assert_frame_equal(df, exp)
+
+        df = integron_finder.read_hmm(self.rep_name, infile, evalue=1e-20, coverage=0.94)
+        # the names of the other queries are not among the categories
+        pdt.assert_frame_equal(df, exp.iloc[:1], check_categorical=False)
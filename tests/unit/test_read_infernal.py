@@ -34,6 +34,7 @@ class TestFunctions(unittest.TestCase):
         df = integron_finder.read_infernal(filename)
         expect = pd.DataFrame(columns=["Accession_number", "cm_attC", "cm_debut",
                                        "cm_fin", "pos_beg", "pos_end", "sens", "evalue"])
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_nohit(self):
@@ -46,6 +47,7 @@ class TestFunctions(unittest.TestCase):
         df = integron_finder.read_infernal(filename)
         expect = pd.DataFrame(columns=["Accession_number", "cm_attC", "cm_debut",
                                        "cm_fin", "pos_beg", "pos_end", "sens", "evalue"])
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_evalue_thres(self):
@@ -59,6 +61,7 @@ class TestFunctions(unittest.TestCase):
         df = integron_finder.read_infernal(filename, evalue=1e-10)
         expect = pd.DataFrame(columns=["Accession_number", "cm_attC", "cm_debut",
                                        "cm_fin", "pos_beg", "pos_end", "sens", "evalue"])
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_generate_df(self):
@@ -83,9 +86,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 19618,
                                 "pos_end": 19726, "sens": "-", "evalue": 1.1e-7},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_attcsize_minthres(self):
@@ -105,9 +106,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 19618,
                                 "pos_end": 19726, "sens": "-", "evalue": 1.1e-7},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_attcsize_maxthres(self):
@@ -127,9 +126,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 19080,
                                 "pos_end": 19149, "sens": "-", "evalue": 1e-4},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_filter_evalue_thres(self):
@@ -145,9 +142,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 17825,
                                 "pos_end": 17884, "sens": "-", "evalue": 1e-9},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_no_total_cm_match_strandp(self):
@@ -172,9 +167,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 10, "cm_fin": 47, "pos_beg": 19609,
                                 "pos_end": 19726, "sens": "+", "evalue": 1.1e-7},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_no_total_cm_match_strandm(self):
@@ -199,9 +192,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 10, "cm_fin": 47, "pos_beg": 19618,
                                 "pos_end": 19735, "sens": "-", "evalue": 1.1e-7},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_attcsize_minthres(self):
@@ -221,9 +212,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 19618,
                                 "pos_end": 19726, "sens": "-", "evalue": 1.1e-7},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_attcsize_maxthres(self):
@@ -243,9 +232,7 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 19080,
                                 "pos_end": 19149, "sens": "-", "evalue": 1e-4},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
     def test_filter_evalue_thres(self):
@@ -261,8 +248,31 @@ class TestFunctions(unittest.TestCase):
                                 "cm_debut": 1, "cm_fin": 47, "pos_beg": 17825,
                                 "pos_end": 17884, "sens": "-", "evalue": 1e-9},
                                ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        expect[intcols] = expect[intcols].astype(int)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(df, expect)
 
+
+    def test_no_total_cm_match_strandpm(self):
+        """
+        Test that when the model did not completely match on the sequence,
+        the start and end positions of hit are well recalculated. Hits are on both strands
+        """
+        filename = os.path.join("tests", "data", "Results_Integron_Finder_" + self.rep_name,
+                                 "other", self.rep_name + "_attc_table-partialpm.res")
+        df = integron_finder.read_infernal(filename)
+        expect = pd.DataFrame(columns=["Accession_number", "cm_attC", "cm_debut",
+                                       "cm_fin", "pos_beg", "pos_end", "sens", "evalue"])
+        expect = expect.append({"Accession_number": self.rep_name, "cm_attC": "attC_4",
+                                "cm_debut": 1, "cm_fin": 40, "pos_beg": 17825,
+                                "pos_end": 17891, "sens": "+", "evalue": 1e-9},
+                               ignore_index=True)
+        expect = expect.append({"Accession_number": self.rep_name, "cm_attC": "attC_4",
+                                "cm_debut": 1, "cm_fin": 47, "pos_beg": 19080,
+                                "pos_end": 19149, "sens": "+", "evalue": 1e-4},
+                               ignore_index=True)
+        expect = expect.append({"Accession_number": self.rep_name, "cm_attC": "attC_4",
+                                "cm_debut": 10, "cm_fin": 47, "pos_beg": 19618,
+                                "pos_end": 19735, "sens": "-", "evalue": 1.1e-7},
+                               ignore_index=True)
+        expect = expect.astype(dtype=integron_finder.ATTC_DTYPE)
+        pdt.assert_frame_equal(df, expect)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests ResultCache class and run_cached function of integron_finder
+"""
+
+import os
+import tempfile
+import shutil
+import unittest
+import argparse
+
+import integron_finder
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        integron_finder.result_cache = integron_finder.ResultCache(os.path.join(self.tmp_dir, 'cache'))
+        self.outputs = [os.path.join(self.tmp_dir, 'foo.res'), os.path.join(self.tmp_dir, 'foo_table.res')]
+        self.runs = []
+
+    def tearDown(self):
+        integron_finder.result_cache = None
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+    def run_tool(self, content):
+        def run():
+            self.runs.append(content)
+            for path in self.outputs:
+                with open(path, 'w') as f:
+                    f.write(content + os.path.basename(path))
+        return run
+
+    def read_outputs(self):
+        contents = []
+        for path in self.outputs:
+            with open(path) as f:
+                contents.append(f.read())
+        return contents
+
+
+    def test_key(self):
+        key = integron_finder.ResultCache.key('foo', None, ['abc'], [1, 'E'])
+        self.assertEqual(key, integron_finder.ResultCache.key('foo', None, ['abc'], [1, 'E']))
+        self.assertNotEqual(key, integron_finder.ResultCache.key('bar', None, ['abc'], [1, 'E']))
+        self.assertNotEqual(key, integron_finder.ResultCache.key('foo', None, ['abd'], [1, 'E']))
+        self.assertNotEqual(key, integron_finder.ResultCache.key('foo', None, ['abc'], [2, 'E']))
+
+
+    def test_run_cached(self):
+        from_cache = integron_finder.run_cached('foo', None, lambda: ['abc'], [1], self.outputs,
+                                                self.run_tool('first'))
+        self.assertFalse(from_cache)
+        self.assertEqual(self.read_outputs(), ['firstfoo.res', 'firstfoo_table.res'])
+        # another output directory
+        for path in self.outputs:
+            os.remove(path)
+        from_cache = integron_finder.run_cached('foo', None, lambda: ['abc'], [1], self.outputs,
+                                                self.run_tool('second'))
+        self.assertTrue(from_cache)
+        self.assertEqual(self.runs, ['first'])
+        self.assertEqual(self.read_outputs(), ['firstfoo.res', 'firstfoo_table.res'])
+
+
+    def test_options_changed(self):
+        integron_finder.run_cached('foo', None, lambda: ['abc'], [1], self.outputs, self.run_tool('first'))
+        integron_finder.run_cached('foo', None, lambda: ['abc'], [2], self.outputs, self.run_tool('second'))
+        self.assertEqual(self.runs, ['first', 'second'])
+        self.assertEqual(self.read_outputs(), ['secondfoo.res', 'secondfoo_table.res'])
+        # the results of the first run are not overwritten by the second one
+        integron_finder.run_cached('foo', None, lambda: ['abc'], [1], self.outputs, self.run_tool('third'))
+        self.assertEqual(self.runs, ['first', 'second'])
+        self.assertEqual(self.read_outputs(), ['firstfoo.res', 'firstfoo_table.res'])
+
+
+    def test_no_cache(self):
+        integron_finder.result_cache = None
+        inputs = []
+        integron_finder.run_cached('foo', None, lambda: inputs.append(1), [1], self.outputs, self.run_tool('first'))
+        integron_finder.run_cached('foo', None, lambda: inputs.append(1), [1], self.outputs, self.run_tool('second'))
+        self.assertEqual(self.runs, ['first', 'second'])
+        self.assertEqual(inputs, [])
+
+
+    def test_local_max_options(self):
+        integron_finder.args = argparse.Namespace(union_integrases=False, no_proteins=False,
+                                                  keep_palindromes=False)
+        integron_finder.evalue_attc = 1.
+        integron_finder.max_attc_size = 200
+        integron_finder.min_attc_size = 40
+        integron_finder.DISTANCE_THRESHOLD = 4000
+        integron_finder.circular = True
+        integron_finder.LOCAL_MAX_BATCH = 1
+        integron_finder.LOCAL_MAX_INDEX = True
+
+        def run_local_max(content):
+            return integron_finder.run_cached('local_max', None, lambda: ['abc'],
+                                              integron_finder.local_max_options(),
+                                              self.outputs, self.run_tool(content))
+
+        self.assertFalse(run_local_max('first'))
+        self.assertTrue(run_local_max('second'))
+        integron_finder.args.keep_palindromes = True
+        self.assertFalse(run_local_max('third'))
+        integron_finder.LOCAL_MAX_BATCH = 4
+        self.assertFalse(run_local_max('fourth'))
+        # --no_local_max_index
+        integron_finder.LOCAL_MAX_INDEX = False
+        try:
+            self.assertFalse(run_local_max('fifth'))
+        finally:
+            integron_finder.LOCAL_MAX_BATCH = 1
+            integron_finder.LOCAL_MAX_INDEX = True
+        self.assertEqual(self.runs, ['first', 'third', 'fourth', 'fifth'])
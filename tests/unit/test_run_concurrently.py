@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests run_concurrently function of integron_finder
+"""
+
+import threading
+import unittest
+
+import integron_finder
+
+
+class TestRunConcurrently(unittest.TestCase):
+
+    def test_results_order(self):
+        jobs = [(lambda x, y: x + y, (1, 2)),
+                (lambda x: x * 2, (5,)),
+                (lambda: 'foo', ())]
+        self.assertEqual(integron_finder.run_concurrently(jobs), [3, 10, 'foo'])
+
+
+    def test_no_job(self):
+        self.assertEqual(integron_finder.run_concurrently([]), [])
+
+
+    def test_concurrent(self):
+        # each job waits for the other one, so they must run at the same time
+        barrier = [threading.Event(), threading.Event()]
+
+        def job(me, other):
+            barrier[me].set()
+            return barrier[other].wait(5)
+
+        jobs = [(job, (0, 1)), (job, (1, 0))]
+        self.assertEqual(integron_finder.run_concurrently(jobs), [True, True])
+
+
+    def test_error(self):
+        def failed():
+            raise RuntimeError("foo failed returncode = 1")
+
+        jobs = [(lambda: 1, ()), (failed, ())]
+        with self.assertRaises(RuntimeError) as ctx:
+            integron_finder.run_concurrently(jobs)
+        self.assertEqual(str(ctx.exception), "foo failed returncode = 1")
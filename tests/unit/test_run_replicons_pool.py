@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests run_replicons_pool function of integron_finder
+"""
+
+import time
+import unittest
+
+import integron_finder
+
+
+def fake_worker(task):
+    start = time.time()
+    time.sleep(0.05)
+    return task, start
+
+
+def failing_worker(task):
+    if task[1] == 'rep2':
+        raise RuntimeError("cmsearch failed")
+    return task
+
+
+class TestRunRepliconsPool(unittest.TestCase):
+
+    def setUp(self):
+        # (fasta_path, record_id, replicon_name, size)
+        self.replicons = [('foo.fst', 'rep1', 'rep1', 20000),
+                          ('foo.fst', 'rep2', 'rep2', 3000000),
+                          ('foo.fst', 'rep3', 'rep3', 150000)]
+
+
+    def test_one_cpu(self):
+        results = integron_finder.run_replicons_pool(self.replicons, 1, fake_worker)
+        self.assertEqual([task for task, _ in results],
+                         [('foo.fst', 'rep1', 'rep1', 1), ('foo.fst', 'rep2', 'rep2', 1),
+                          ('foo.fst', 'rep3', 'rep3', 1)])
+        # the biggest replicon first
+        starts = [start for _, start in results]
+        self.assertTrue(starts[1] < starts[2] < starts[0])
+
+
+    def test_share_cpu(self):
+        results = integron_finder.run_replicons_pool(self.replicons, 4, fake_worker, ['a', 'b', 'c'])
+        self.assertEqual([task for task, _ in results],
+                         [('foo.fst', 'rep1', 'rep1', 2, 'a'), ('foo.fst', 'rep2', 'rep2', 4, 'b'),
+                          ('foo.fst', 'rep3', 'rep3', 2, 'c')])
+        starts = [start for _, start in results]
+        # the small replicons wait for the cpus of the big one, then run at the same time
+        self.assertTrue(starts[1] < starts[0] and starts[1] < starts[2])
+        self.assertTrue(abs(starts[0] - starts[2]) < 0.04)
+
+
+    def test_no_replicon(self):
+        self.assertEqual(integron_finder.run_replicons_pool([], 4, fake_worker), [])
+
+
+    def test_worker_failed(self):
+        with self.assertRaises(RuntimeError):
+            integron_finder.run_replicons_pool(self.replicons, 2, failing_worker)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests schedule_replicons function of integron_finder
+"""
+
+import unittest
+
+import integron_finder
+
+
+class TestScheduleReplicons(unittest.TestCase):
+
+    def test_small_replicons(self):
+        sizes = [20000, 150000, 50000, 80000, 3000]
+        rounds = integron_finder.schedule_replicons(sizes, 4)
+        self.assertEqual(rounds, [(1, 4, [1, 3, 2, 0, 4])])
+
+
+    def test_one_replicon(self):
+        rounds = integron_finder.schedule_replicons([20000], 4)
+        self.assertEqual(rounds, [(4, 1, [0])])
+
+
+    def test_mixed_replicons(self):
+        sizes = [5000000, 20000, 2500000, 40000, 60000, 1500000]
+        rounds = integron_finder.schedule_replicons(sizes, 4)
+        # the rounds with only one replicon get all cpus for the searches
+        self.assertEqual(rounds, [(4, 1, [0]),
+                                  (4, 1, [2]),
+                                  (4, 1, [5]),
+                                  (1, 3, [4, 3, 1])])
+
+
+    def test_one_cpu(self):
+        sizes = [5000000, 20000]
+        rounds = integron_finder.schedule_replicons(sizes, 1)
+        self.assertEqual(rounds, [(1, 1, [0, 1])])
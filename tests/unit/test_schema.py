@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests cast_table and empty_table functions of integron_finder
+"""
+
+import os
+import argparse
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import integron_finder
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_empty_table(self):
+        df = integron_finder.empty_table(integron_finder.ATTC_COLUMNS, integron_finder.ATTC_DTYPE)
+        self.assertTrue(df.empty)
+        self.assertEqual(list(df.columns), integron_finder.ATTC_COLUMNS)
+        self.assert_attc_dtypes(df)
+        df = integron_finder.empty_table(integron_finder.HMM_COLUMNS, integron_finder.HMM_DTYPE)
+        self.assert_hmm_dtypes(df)
+
+
+    def assert_attc_dtypes(self, df):
+        self.assertEqual(df.Accession_number.dtype.name, 'category')
+        self.assertEqual(df.cm_attC.dtype.name, 'category')
+        for column in ('cm_debut', 'cm_fin', 'pos_beg', 'pos_end'):
+            self.assertEqual(df[column].dtype, np.dtype(np.int32))
+        self.assertEqual(df.evalue.dtype, np.dtype(float))
+        self.assertEqual(df.sens.dtype, np.dtype(object))
+
+
+    def assert_hmm_dtypes(self, df):
+        self.assertEqual(df.Accession_number.dtype.name, 'category')
+        self.assertEqual(df.query_name.dtype.name, 'category')
+        self.assertEqual(df.strand.dtype, np.dtype(np.int8))
+        self.assertEqual(df.pos_beg.dtype, np.dtype(np.int32))
+        self.assertEqual(df.pos_end.dtype, np.dtype(np.int32))
+        self.assertEqual(df.evalue.dtype, np.dtype(float))
+        self.assertEqual(df.ID_prot.dtype, np.dtype(object))
+
+
+    def test_read_infernal(self):
+        integron_finder.replicon_name = "acba.007.p01.13"
+        integron_finder.length_cm = 47
+        df = integron_finder.read_infernal(os.path.join("tests", "data", "Results_Integron_Finder_acba.007.p01.13",
+                                                        "other", "acba.007.p01.13_attc_table.res"))
+        self.assertEqual(len(df), 3)
+        self.assert_attc_dtypes(df)
+        self.assertEqual(df.cm_attC.cat.categories.tolist(), ["attC_4"])
+
+
+    def test_read_hmm(self):
+        integron_finder.args = argparse.Namespace(gembase=False)
+        df = integron_finder.read_hmm("acba.007.p01.13",
+                                      os.path.join("tests", "data", "fictive_results", "acba.007.p01.13_intI_domtbl.res"))
+        self.assertEqual(len(df), 3)
+        self.assert_hmm_dtypes(df)
+        self.assertEqual(df.query_name.cat.categories.tolist(), ["Phage_integrase", "intI_Cterm"])
+
+
+    def test_cast_table(self):
+        df = pd.DataFrame({"ID_prot": ["foo_1"], "pos_beg": ["55"], "pos_end": [1014], "evalue": [1e-25]},
+                          columns=["ID_prot", "pos_beg", "pos_end", "evalue"])
+        df = integron_finder.cast_table(df, integron_finder.HMM_DTYPE)
+        self.assertEqual(df.pos_beg.dtype, np.dtype(np.int32))
+        self.assertEqual(df.pos_beg.values[0], 55)
+        self.assertEqual(df.pos_end.dtype, np.dtype(np.int32))
+        # the columns missing from the table are ignored
+        self.assertEqual(list(df.columns), ["ID_prot", "pos_beg", "pos_end", "evalue"])
@@ -70,9 +70,7 @@ class TestFunctions(unittest.TestCase):
                                     "cm_debut": 1, "cm_fin": 47, "pos_beg": 19618,
                                     "pos_end": 19726, "sens": "-", "evalue": 1.1e-7},
                                     ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_res[intcols] = attc_res[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(attc_res, attc_array[0])
 
 
@@ -117,10 +115,8 @@ class TestFunctions(unittest.TestCase):
                                       "cm_debut": 1, "cm_fin": 47, "pos_beg": 15000,
                                       "pos_end": 16000, "sens": "+", "evalue": 0.19},
                                      ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_res[intcols] = attc_res[intcols].astype(int)
-        attc_res2[intcols] = attc_res2[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res2 = attc_res2.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(attc_res, attc_array[1])
         pdt.assert_frame_equal(attc_res2, attc_array[0])
 
@@ -168,10 +164,8 @@ class TestFunctions(unittest.TestCase):
                                       "cm_debut": 1, "cm_fin": 47, "pos_beg": 12900,
                                       "pos_end": 13800, "sens": "-", "evalue": 1e-03},
                                      ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_res[intcols] = attc_res[intcols].astype(int)
-        attc_res2[intcols] = attc_res2[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res2 = attc_res2.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(attc_res, attc_array[1])
         pdt.assert_frame_equal(attc_res2, attc_array[0])
 
@@ -238,11 +232,9 @@ class TestFunctions(unittest.TestCase):
                                       "cm_debut": 1, "cm_fin": 47, "pos_beg": 7100,
                                       "pos_end": 8200, "sens": "+", "evalue": 1e-03},
                                      ignore_index=True)
-        # convert positions to int
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_res[intcols] = attc_res[intcols].astype(int)
-        attc_res2[intcols] = attc_res2[intcols].astype(int)
-        attc_res3[intcols] = attc_res3[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res2 = attc_res2.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res3 = attc_res3.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(attc_res, attc_array[2])
         pdt.assert_frame_equal(attc_res2, attc_array[1])
         pdt.assert_frame_equal(attc_res3, attc_array[0])
@@ -272,8 +264,7 @@ class TestFunctions(unittest.TestCase):
                                     "cm_debut": 1, "cm_fin": 47, "pos_beg": 19815,
                                     "pos_end": 20000, "sens": "-", "evalue": 1.1e-7},
                                     ignore_index=True)
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_df[intcols] = attc_df[intcols].astype(int)
+        attc_df = attc_df.astype(dtype=integron_finder.ATTC_DTYPE)
 
         attc_array = integron_finder.search_attc(attc_df, True)
         self.assertEqual(len(attc_array), 1)
@@ -311,8 +302,7 @@ class TestFunctions(unittest.TestCase):
                                     "cm_debut": 1, "cm_fin": 47, "pos_beg": 19815,
                                     "pos_end": 20000, "sens": "+", "evalue": 1.1e-7},
                                     ignore_index=True)
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_df[intcols] = attc_df[intcols].astype(int)
+        attc_df = attc_df.astype(dtype=integron_finder.ATTC_DTYPE)
 
         attc_array = integron_finder.search_attc(attc_df, True)
         self.assertEqual(len(attc_array), 1)
@@ -348,8 +338,7 @@ class TestFunctions(unittest.TestCase):
                                     "cm_debut": 1, "cm_fin": 47, "pos_beg": 5500,
                                     "pos_end": 7000, "sens": "+", "evalue": 1.1e-7},
                                     ignore_index=True)
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_df[intcols] = attc_df[intcols].astype(int)
+        attc_df = attc_df.astype(dtype=integron_finder.ATTC_DTYPE)
 
         attc_array = integron_finder.search_attc(attc_df, False)
         self.assertEqual(len(attc_array), 1)
@@ -370,7 +359,7 @@ class TestFunctions(unittest.TestCase):
                                     "pos_end": 7000, "sens": "+", "evalue": 1.1e-7},
                                     ignore_index=True)
 
-        attc_res[intcols] = attc_res[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
         attc_array[0].reset_index(inplace=True, drop=True)
         pdt.assert_frame_equal(attc_res, attc_array[0])
 
@@ -397,8 +386,7 @@ class TestFunctions(unittest.TestCase):
                                     "cm_debut": 1, "cm_fin": 47, "pos_beg": 5500,
                                     "pos_end": 7000, "sens": "-", "evalue": 1.1e-7},
                                     ignore_index=True)
-        intcols = ["cm_debut", "cm_fin", "pos_beg", "pos_end"]
-        attc_df[intcols] = attc_df[intcols].astype(int)
+        attc_df = attc_df.astype(dtype=integron_finder.ATTC_DTYPE)
 
         attc_array = integron_finder.search_attc(attc_df, False)
         self.assertEqual(len(attc_array), 3)
@@ -424,9 +412,9 @@ class TestFunctions(unittest.TestCase):
                                 index=[0])
         attc_res3 = attc_res3[columns]
 
-        attc_res[intcols] = attc_res[intcols].astype(int)
-        attc_res2[intcols] = attc_res2[intcols].astype(int)
-        attc_res3[intcols] = attc_res3[intcols].astype(int)
+        attc_res = attc_res.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res2 = attc_res2.astype(dtype=integron_finder.ATTC_DTYPE)
+        attc_res3 = attc_res3.astype(dtype=integron_finder.ATTC_DTYPE)
         pdt.assert_frame_equal(attc_res2, attc_array[0])
         pdt.assert_frame_equal(attc_res, attc_array[1])
         pdt.assert_frame_equal(attc_res3, attc_array[2])
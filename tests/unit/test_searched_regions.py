@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests SearchedRegions class and its use by local_max
+"""
+
+import unittest
+
+import pandas as pd
+import pandas.util.testing as pdt
+
+import integron_finder
+_search_window_ori = integron_finder._search_window
+
+
+def hits(rows):
+    return pd.DataFrame(rows, columns=['Accession_number', 'cm_attC', 'cm_debut', 'cm_fin',
+                                       'pos_beg', 'pos_end', 'sens', 'evalue']
+                        ).astype(dtype=integron_finder.ATTC_DTYPE)
+
+
+class TestSearchedRegions(unittest.TestCase):
+
+    def setUp(self):
+        self.regions = integron_finder.SearchedRegions(20000)
+
+    def test_uncovered(self):
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'top'), [(1000, 5000)])
+        self.regions.add(2000, 3000, 'top', hits([]))
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'top'), [(1000, 2000), (3000, 5000)])
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'bottom'), [(1000, 5000)])
+        self.assertEqual(self.regions.uncovered(2500, 2800, 'top'), [])
+        self.regions.add(2900, 6000, 'both', hits([]))
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'top'), [(1000, 2000)])
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'bottom'), [(1000, 2900)])
+        self.assertEqual(self.regions.uncovered(1000, 5000, 'both'), [(1000, 2900)])
+
+
+    def test_uncovered_circular(self):
+        self.assertEqual(self.regions.uncovered(18000, 1000, 'top'), [(0, 1000), (18000, 20000)])
+        self.regions.add(19000, 500, 'top', hits([]))
+        self.assertEqual(self.regions.uncovered(18000, 1000, 'top'), [(500, 1000), (18000, 19000)])
+
+
+    def test_hits(self):
+        self.regions.add(1000, 5000, 'both', hits([['foo', 'attC_4', 1, 47, 1200, 1300, '+', 0.1],
+                                                   ['foo', 'attC_4', 1, 47, 4000, 4100, '-', 0.01]]))
+        self.regions.add(4000, 8000, 'top', hits([['foo', 'attC_4', 1, 47, 6000, 6100, '+', 0.001]]))
+        pdt.assert_frame_equal(self.regions.hits(1000, 8000, 'top'),
+                               hits([['foo', 'attC_4', 1, 47, 6000, 6100, '+', 0.001],
+                                     ['foo', 'attC_4', 1, 47, 1200, 1300, '+', 0.1]]))
+        pdt.assert_frame_equal(self.regions.hits(3000, 5000, 'both'),
+                               hits([['foo', 'attC_4', 1, 47, 4000, 4100, '-', 0.01]]))
+        self.assertTrue(self.regions.hits(1000, 1250, 'top').empty)
+
+
+    def test_hits_overlapping(self):
+        # the same attC found with other bounds by 2 searches, only the best one is kept
+        self.regions.add(1000, 5020, 'top', hits([['foo', 'attC_4', 1, 47, 4900, 5000, '+', 0.01]]))
+        self.regions.add(4820, 9000, 'top', hits([['foo', 'attC_4', 1, 47, 4950, 5060, '+', 0.001],
+                                                  ['foo', 'attC_4', 1, 47, 4950, 5060, '-', 0.1]]))
+        pdt.assert_frame_equal(self.regions.hits(1000, 9000, 'both'),
+                               hits([['foo', 'attC_4', 1, 47, 4950, 5060, '+', 0.001],
+                                     ['foo', 'attC_4', 1, 47, 4950, 5060, '-', 0.1]]))
+
+
+class TestLocalMaxSearchedRegions(unittest.TestCase):
+
+    def setUp(self):
+        integron_finder.SIZE_REPLICON = 20000
+        integron_finder.max_attc_size = 200
+        integron_finder.N_CPU = '1'
+        integron_finder.searched_regions = integron_finder.SearchedRegions(20000)
+        self.searches = []
+        self.attc = hits([['foo', 'attC_4', 1, 47, 1200, 1300, '+', 0.1],
+                          ['foo', 'attC_4', 1, 47, 4000, 4100, '-', 0.01],
+                          ['foo', 'attC_4', 1, 47, 6000, 6100, '+', 0.001]])
+
+        def fake_search_window(replicon_name, window_beg, window_end, strand_search, cpu):
+            self.searches.append((window_beg, window_end, strand_search))
+            attc = self.attc[(self.attc.pos_beg >= window_beg) & (self.attc.pos_end <= window_end)]
+            if strand_search != 'both':
+                attc = attc[attc.sens == ('+' if strand_search == 'top' else '-')]
+            # as cmsearch --max, the overlapping hits of a search are resolved
+            attc = attc.sort_values('evalue', kind='mergesort')
+            return attc[integron_finder.SearchedRegions(20000)._best_non_overlapping(attc)]
+
+        integron_finder._search_window = fake_search_window
+
+    def tearDown(self):
+        integron_finder._search_window = _search_window_ori
+        integron_finder.searched_regions = None
+
+
+    def test_search_uncovered_parts(self):
+        first = integron_finder.local_max('foo', 1000, 5000, 'both')
+        self.assertEqual(len(first), 2)
+        second = integron_finder.local_max('foo', 4800, 9000, 'top')
+        self.assertEqual(self.searches, [(1000, 5000, 'both'), (4800, 9000, 'top')])
+        self.assertEqual(second.pos_beg.tolist(), [6000])
+        # top and bottom strands are answered from the search on both strands
+        bottom = integron_finder.local_max('foo', 3000, 5000, 'bottom')
+        self.assertEqual(bottom.pos_beg.tolist(), [4000])
+        third = integron_finder.local_max('foo', 0, 7000, 'top')
+        self.assertEqual(self.searches[2:], [(0, 1200, 'top')])
+        self.assertEqual(third.pos_beg.tolist(), [6000, 1200])
+
+
+    def test_no_index(self):
+        integron_finder.searched_regions = None
+        integron_finder.local_max('foo', 1000, 5000, 'both')
+        integron_finder.local_max('foo', 1000, 5000, 'both')
+        self.assertEqual(self.searches, [(1000, 5000, 'both')] * 2)
+
+
+    def test_same_as_whole_window(self):
+        self.attc = hits([['foo', 'attC_4', 1, 47, 1200, 1300, '+', 0.1],
+                          ['foo', 'attC_4', 1, 47, 4900, 5000, '+', 0.01],
+                          ['foo', 'attC_4', 1, 47, 4950, 5060, '+', 0.001],
+                          ['foo', 'attC_4', 1, 47, 6000, 6100, '+', 0.0001]])
+        integron_finder.local_max('foo', 1000, 5020, 'top')
+        indexed = integron_finder.local_max('foo', 1000, 9000, 'top')
+        self.assertEqual(self.searches, [(1000, 5020, 'top'), (4820, 9000, 'top')])
+        integron_finder.searched_regions = None
+        whole = integron_finder.local_max('foo', 1000, 9000, 'top')
+        self.assertEqual(sorted(zip(indexed.pos_beg, indexed.pos_end, indexed.evalue)),
+                         sorted(zip(whole.pos_beg, whole.pos_end, whole.evalue)))
+        self.assertEqual(sorted(indexed.pos_beg), [1200, 4950, 6000])
+
+
+    def test_covered_same_as_fresh_search(self):
+        self.attc = hits([['foo', 'attC_4', 1, 47, 1200, 1300, '+', 0.1],
+                          ['foo', 'attC_4', 1, 47, 2900, 3000, '+', 0.01],
+                          ['foo', 'attC_4', 1, 47, 2950, 3060, '+', 0.001],
+                          ['foo', 'attC_4', 1, 47, 4000, 4100, '-', 0.01],
+                          ['foo', 'attC_4', 1, 47, 6000, 6100, '+', 0.0001]])
+        integron_finder.local_max('foo', 1000, 3020, 'both')
+        integron_finder.local_max('foo', 2820, 7000, 'top')
+        # the window is covered by the previous searches, cmsearch is not run
+        covered = integron_finder.local_max('foo', 2000, 6500, 'top')
+        self.assertEqual(len(self.searches), 2)
+        # --no_local_max_index
+        integron_finder.searched_regions = None
+        fresh = integron_finder.local_max('foo', 2000, 6500, 'top')
+        self.assertEqual(self.searches[2:], [(2000, 6500, 'top')])
+        fresh.index = range(len(fresh))
+        pdt.assert_frame_equal(covered, fresh)
@@ -7,6 +7,7 @@ Unit tests func_annot function of integron_finder
 
 import integron_finder
 import unittest
+import argparse
 import pandas as pd
 import numpy as np
 import os
@@ -28,6 +29,8 @@ class TestFunctions(unittest.TestCase):
                                                  "acba.007.p01.13.prt")
         integron_finder.DISTANCE_THRESHOLD = 4000
         integron_finder.SIZE_REPLICON = len(self.seq)
+        integron_finder.args = argparse.Namespace()
+        integron_finder.args.gembase = False
 
     def tearDown(self):
         """
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Unit tests WindowCache class of integron_finder
+"""
+
+import os
+import tempfile
+import shutil
+import unittest
+
+from Bio import Seq, SeqIO
+from Bio.SeqRecord import SeqRecord
+
+import integron_finder
+
+
+class TestWindowCache(unittest.TestCase):
+
+    _data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', "data"))
+
+    def setUp(self):
+        if 'INTEGRON_HOME' in os.environ:
+            self.integron_home = os.environ['INTEGRON_HOME']
+        else:
+            self.integron_home = os.path.normpath(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+        self.tmp_dir = os.path.join(tempfile.gettempdir(), 'tmp_test_integron_finder')
+        os.makedirs(self.tmp_dir)
+        integron_finder.MODEL_attc = os.path.join(self.integron_home, 'data', 'Models', 'attc_4.cm')
+        integron_finder.SIZE_REPLICON = 20301
+        self.cache = integron_finder.WindowCache(os.path.join(self.tmp_dir, 'cache'), 100)
+
+    def tearDown(self):
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+
+    def test_key(self):
+        seq = SeqRecord(Seq.Seq("ACGTACGT"), id="foo")
+        key = self.cache.key(seq, "both")
+        self.assertEqual(key, self.cache.key(SeqRecord(Seq.Seq("acgtacgt"), id="bar"), "both"))
+        self.assertNotEqual(key, self.cache.key(seq, "top"))
+        self.assertNotEqual(key, self.cache.key(SeqRecord(Seq.Seq("ACGTACGA"), id="foo"), "both"))
+        integron_finder.SIZE_REPLICON = 20302
+        self.assertNotEqual(key, self.cache.key(seq, "both"))
+
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get("foo"))
+        self.cache.put("foo", "#header\n#footer\n")
+        self.assertEqual(self.cache.get("foo"), "#header\n#footer\n")
+        # the cache is persistent
+        cache = integron_finder.WindowCache(os.path.join(self.tmp_dir, 'cache'), 100)
+        self.assertEqual(cache.get("foo"), "#header\n#footer\n")
+
+
+    def test_eviction(self):
+        for key in ("foo", "bar", "baz"):
+            self.cache.put(key, "x" * 40)
+        self.assertIsNone(self.cache.get("foo"))
+        self.assertEqual(self.cache.get("bar"), "x" * 40)
+        self.cache.put("qux", "x" * 40)
+        # bar has been used more recently than baz
+        self.assertIsNone(self.cache.get("baz"))
+        self.assertEqual(self.cache.get("bar"), "x" * 40)
+        self.assertEqual(self.cache.get("qux"), "x" * 40)